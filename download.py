@@ -6,30 +6,42 @@ This script installs all required dependencies for the Easy AI Speaker Avatar Sy
 Run this once to install all packages, then use run.py for normal operation.
 """
 
+import importlib
+import importlib.util
 import subprocess
 import sys
 import os
 
-def install_package(package_name, import_name=None):
-    """Install a package and verify it can be imported."""
-    if import_name is None:
-        import_name = package_name
-    
+def is_installed(import_name):
+    """Check whether a module can be imported without actually importing it."""
     try:
-        # Try to import the package first
-        __import__(import_name)
-        print(f"  ✅ {package_name} already installed")
-        return True
-    except ImportError:
-        pass
-    
-    print(f"  📦 Installing {package_name}...")
+        return importlib.util.find_spec(import_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+def pip_install(package_names, *options):
+    """Run a single pip install for several packages."""
+    subprocess.check_call([
+        sys.executable, "-m", "pip", "install",
+        "--disable-pip-version-check", "--no-input", "--quiet",
+        *options, *package_names
+    ])
+
+def install_packages(package_names):
+    """Install several packages with a single pip invocation."""
+    print(f"  📦 Installing {', '.join(package_names)}...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package_name])
-        print(f"  ✅ {package_name} installed successfully")
+        # Prefer prebuilt wheels so packages like opencv-python never
+        # fall back to a slow source build
+        try:
+            pip_install(package_names, "--only-binary=:all:")
+        except subprocess.CalledProcessError:
+            print("  ⚠️  Some packages have no wheel for this platform, retrying with source builds allowed...")
+            pip_install(package_names)
+        print("  ✅ Packages installed successfully")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"  ❌ Failed to install {package_name}: {e}")
+        print(f"  ❌ Failed to install packages: {e}")
         return False
 
 def main():
@@ -52,14 +64,22 @@ def main():
         ("google-generativeai", "google.generativeai"),
         ("PyPDF2", "PyPDF2"),
         ("pdf2image", "pdf2image"),
+        ("pypdfium2", "pypdfium2"),
     ]
     
-    success_count = 0
-    total_packages = len(packages)
-    
+    missing = []
     for package_name, import_name in packages:
-        if install_package(package_name, import_name):
-            success_count += 1
+        if is_installed(import_name):
+            print(f"  ✅ {package_name} already installed")
+        else:
+            missing.append((package_name, import_name))
+    
+    if missing:
+        install_packages([package_name for package_name, _ in missing])
+        importlib.invalidate_caches()
+    
+    total_packages = len(packages)
+    success_count = total_packages - sum(1 for _, import_name in missing if not is_installed(import_name))
     
     print()
     print("=" * 60)
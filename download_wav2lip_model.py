@@ -6,9 +6,53 @@ This script downloads the required Wav2Lip model weights.
 """
 
 import os
+import hashlib
+import shutil
 import requests
 import gdown
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+# No published size or hash for wav2lip_gan.pth could be confirmed, so a
+# download is checked by content: torch checkpoints are either a zip archive
+# (torch >= 1.6) or a pickle (older releases, like the original Wav2Lip
+# weights). A Google Drive quota or error page is HTML and matches neither
+CHECKPOINT_MAGIC = (b"PK\x03\x04", b"\x80\x02")
+# Lower bound only: the GAN weights are a few hundred MB, a cut-off download is not
+WAV2LIP_GAN_MIN_SIZE = 300 * 1024 * 1024
+
+def create_session():
+    """Create an HTTP session that reuses connections across requests"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=4)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def sha256_file(path):
+    """Compute a file's SHA256 digest, reading it in 1 MB blocks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def is_verified(path, expected_sha256_prefix):
+    """Check a downloaded file against the start of its known SHA256"""
+    if not path.exists() or path.stat().st_size == 0:
+        return False
+    return sha256_file(path).startswith(expected_sha256_prefix)
+
+def looks_like_checkpoint(path, min_size):
+    """Check that a file is plausibly a complete torch checkpoint rather than an error page"""
+    if not path.exists() or path.stat().st_size < min_size:
+        return False
+    with open(path, 'rb') as f:
+        header = f.read(4)
+    return header.startswith(CHECKPOINT_MAGIC)
 
 def download_wav2lip_model():
     """Download Wav2Lip GAN model weights"""
@@ -22,13 +66,26 @@ def download_wav2lip_model():
     model_id = "15G3U08c8xsCkOqQxE38Z2XXDnPcOptNk"
     output_path = checkpoints_dir / "wav2lip_gan.pth"
     
+    if looks_like_checkpoint(output_path, WAV2LIP_GAN_MIN_SIZE):
+        print(f"✅ Wav2Lip GAN model already downloaded and verified: {output_path}")
+        return True
+    
     print("🔽 Downloading Wav2Lip GAN model weights...")
     print(f"   Source: Google Drive ID {model_id}")
     print(f"   Destination: {output_path}")
     
     try:
-        # Download using gdown
-        gdown.download(f"https://drive.google.com/uc?id={model_id}", str(output_path), quiet=False)
+        # Download to a temporary path with gdown's resume support, so an
+        # interrupted download continues where it stopped, then move it into place
+        tmp_path = output_path.with_name(output_path.name + ".part")
+        gdown.download(f"https://drive.google.com/uc?id={model_id}", str(tmp_path), quiet=False, resume=True)
+        if not looks_like_checkpoint(tmp_path, WAV2LIP_GAN_MIN_SIZE):
+            size = tmp_path.stat().st_size if tmp_path.exists() else 0
+            tmp_path.unlink(missing_ok=True)
+            print(f"❌ ERROR: Downloaded file ({size} bytes) is not a model checkpoint "
+                  "(Google Drive may have returned a quota or error page)")
+            return False
+        os.replace(tmp_path, output_path)
         
         if output_path.exists() and output_path.stat().st_size > 0:
             print(f"✅ SUCCESS: Downloaded Wav2Lip GAN model to {output_path}")
@@ -53,21 +110,43 @@ def download_face_detection_model():
     face_detection_dir = Path("Wav2Lip/face_detection/detection/sfd")
     face_detection_dir.mkdir(parents=True, exist_ok=True)
     
-    # Face detection model URL
+    # Face detection model URL (the filename carries the start of its SHA256)
     model_url = "https://www.adrianbulat.com/downloads/python-fan/s3fd-619a316812.pth"
+    model_sha256_prefix = "619a316812"
     output_path = face_detection_dir / "s3fd.pth"
     
+    if is_verified(output_path, model_sha256_prefix):
+        print(f"\n✅ Face detection model already downloaded and verified: {output_path}")
+        return True
+    
     print("\n🔽 Downloading face detection model weights...")
     print(f"   Source: {model_url}")
     print(f"   Destination: {output_path}")
     
     try:
-        response = requests.get(model_url, stream=True)
-        response.raise_for_status()
+        # Resume a partial download with an HTTP Range request when possible
+        tmp_path = output_path.with_name(output_path.name + ".part")
+        offset = tmp_path.stat().st_size if tmp_path.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
         
-        with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        with create_session() as session:
+            response = session.get(model_url, stream=True, headers=headers)
+            if response.status_code == 416:
+                # The partial file is already complete
+                response.close()
+            else:
+                response.raise_for_status()
+                mode = 'ab' if offset and response.status_code == 206 else 'wb'
+                
+                response.raw.decode_content = True
+                with open(tmp_path, mode) as f:
+                    shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+        
+        if not is_verified(tmp_path, model_sha256_prefix):
+            tmp_path.unlink(missing_ok=True)
+            print("❌ ERROR: Downloaded face detection model failed checksum verification")
+            return False
+        os.replace(tmp_path, output_path)
         
         if output_path.exists() and output_path.stat().st_size > 0:
             print(f"✅ SUCCESS: Downloaded face detection model to {output_path}")
@@ -96,15 +175,13 @@ def main():
         subprocess.check_call([sys.executable, "-m", "pip", "install", "gdown"])
         import gdown
     
-    success_count = 0
-    
-    # Download Wav2Lip GAN model
-    if download_wav2lip_model():
-        success_count += 1
-    
-    # Download face detection model
-    if download_face_detection_model():
-        success_count += 1
+    # The two models come from different hosts, so download them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(download_wav2lip_model),
+            executor.submit(download_face_detection_model),
+        ]
+        success_count = sum(1 for future in futures if future.result())
     
     print("\n" + "=" * 40)
     if success_count == 2:
@@ -98,17 +98,17 @@ document.addEventListener('DOMContentLoaded', () => {
                 })
             });
 
-            const result = await response.json();
-
-            if (result.success && result.download_url) {
-                // Create audio element and play the preview
-                const audio = new Audio(`http://localhost:5000${result.download_url}`);
+            if (response.ok) {
+                // The response body is the WAV itself, so play it without a second request
+                const audioUrl = URL.createObjectURL(await response.blob());
+                const audio = new Audio(audioUrl);
                 
                 audio.onloadstart = () => {
                     previewVoiceBtn.innerHTML = '<i class="fas fa-volume-up"></i><span class="hidden sm:inline">Playing...</span>';
                 };
                 
                 audio.onended = () => {
+                    URL.revokeObjectURL(audioUrl);
                     previewVoiceBtn.innerHTML = '<i class="fas fa-play"></i><span class="hidden sm:inline">Preview</span>';
                     previewVoiceBtn.disabled = false;
                 };
@@ -120,6 +120,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 audio.play();
                 
             } else {
+                const result = await response.json();
                 throw new Error(result.error || 'Failed to generate preview');
             }
         } catch (error) {
@@ -8,41 +8,62 @@ import os
 import sys
 import subprocess
 import logging
+import logging.handlers
 import time
 import json
+import re
 import shutil
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
 from datetime import datetime
 import tempfile
 import threading
+import queue
+import atexit
 import base64
+import hashlib
+import uuid
+import zipfile
+import wave
+import urllib.request
+import weakref
+import importlib.metadata
 from io import BytesIO
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import lru_cache
 
 # Check if dependencies are available
 def check_dependencies():
     """Check if all required dependencies are available"""
+    # Installed distributions are looked up in package metadata instead of
+    # importing each package; alternatives cover builds like opencv headless
     required_packages = {
-        "pptx": "python-pptx",
-        "PIL": "Pillow", 
-        "cv2": "opencv-python",
-        "pyttsx3": "pyttsx3",
-        "tqdm": "tqdm",
-        "numpy": "numpy",
-        "flask": "flask",
-        "flask_cors": "flask-cors",
-        "google.generativeai": "google-generativeai",
-        "PyPDF2": "PyPDF2",
-        "pdf2image": "pdf2image"
+        "python-pptx": ("python-pptx",),
+        "Pillow": ("Pillow",),
+        "opencv-python": ("opencv-python", "opencv-python-headless",
+                          "opencv-contrib-python", "opencv-contrib-python-headless"),
+        "pyttsx3": ("pyttsx3",),
+        "tqdm": ("tqdm",),
+        "numpy": ("numpy",),
+        "flask": ("flask",),
+        "flask-cors": ("flask-cors",),
     }
     
-    missing_packages = []
-    
-    for import_name, package_name in required_packages.items():
+    def is_installed(distribution_name):
         try:
-            __import__(import_name)
-        except ImportError:
-            missing_packages.append(package_name)
+            importlib.metadata.distribution(distribution_name)
+            return True
+        except importlib.metadata.PackageNotFoundError:
+            return False
+    
+    missing_packages = [
+        package_name for package_name, distributions in required_packages.items()
+        if not any(is_installed(name) for name in distributions)
+    ]
     
     if missing_packages:
         print("❌ Missing required packages:")
@@ -55,28 +76,218 @@ def check_dependencies():
     
     print("✅ All dependencies are available")
 
-# Check dependencies before importing
-check_dependencies()
+# Check dependencies before importing (set SKIP_DEP_CHECK to skip during development)
+if not os.environ.get("SKIP_DEP_CHECK"):
+    check_dependencies()
 
 # Now import the dependencies
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify, send_file, send_from_directory
 from flask_cors import CORS
 import numpy as np
+import cv2
 from pptx import Presentation
 from PIL import Image, ImageDraw, ImageFont
 from tqdm import tqdm
 
-# Setup logging
+# Optional backends are imported once here instead of inside hot methods;
+# a missing one is None and the code paths that need it report the failure
+try:
+    import pyttsx3
+except ImportError:
+    pyttsx3 = None
+
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+
+try:
+    from pdf2image import convert_from_path
+except ImportError:
+    convert_from_path = None
+
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None  # Audio durations fall back to ffprobe
+
+try:
+    import pypdfium2
+except ImportError:
+    pypdfium2 = None  # PDFs fall back to PyPDF2 text and pdf2image rendering
+
+try:
+    import pyspng
+except ImportError:
+    pyspng = None  # Slide PNGs fall back to PIL's encoder
+
+# Setup logging: records are formatted by the caller but written to the log
+# file and console by a background listener thread, keeping I/O off the pipeline
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler('easy_system.log', encoding='utf-8'),
+    logging.StreamHandler()
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('easy_system.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> str:
+    """Absolute path of a program on PATH, or the name itself if it is not found"""
+    return shutil.which(name) or name
+
+def spawn_args(cmd: List[str]) -> List[str]:
+    """Command with an absolute program path, so subprocess can use posix_spawn
+    
+    CPython only takes the posix_spawn fast path (no fork of a large parent)
+    for an absolute executable, close_fds=False and no cwd. Skipping the fd
+    sweep is safe because Python opens files non-inheritable by default.
+    """
+    return [_resolve_executable(cmd[0]), *cmd[1:]]
+
+def run_streamed(cmd: List[str], idle_timeout: Optional[float] = None, cwd: Optional[str] = None,
+                 log_level: int = logging.DEBUG, env: Optional[Dict[str, str]] = None) -> Tuple[int, str]:
+    """Run a command, streaming its combined output to the log line by line
+    
+    Only the last lines are kept in memory, so a chatty child can neither
+    stall on a full pipe nor grow the parent's memory. The child is killed
+    if it prints nothing for idle_timeout seconds, so long but healthy jobs
+    run to completion while hangs are still caught. Returns the exit code
+    and the tail of the output; raises subprocess.TimeoutExpired on a hang.
+    """
+    proc = subprocess.Popen(spawn_args(cmd), stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            text=True, errors='replace', bufsize=1, cwd=cwd, env=env, close_fds=False)
+    tail = deque(maxlen=200)
+    last_activity = time.monotonic()
+    
+    def drain():
+        nonlocal last_activity
+        for line in proc.stdout:
+            last_activity = time.monotonic()
+            line = line.rstrip()
+            if line:
+                tail.append(line)
+                logger.log(log_level, line)
+    
+    reader = threading.Thread(target=drain, daemon=True)
+    reader.start()
+    try:
+        while True:
+            try:
+                proc.wait(timeout=0.5)
+                break
+            except subprocess.TimeoutExpired:
+                if idle_timeout and time.monotonic() - last_activity > idle_timeout:
+                    proc.kill()
+                    proc.wait()
+                    raise
+    finally:
+        reader.join()
+    return proc.returncode, "\n".join(tail)
+
+# Prefix for pipeline ffmpeg jobs: only errors are logged, but the progress
+# line is kept because it is the heartbeat run_streamed's watchdog relies on.
+# -nostdin stops ffmpeg polling for keypresses (and stalling when backgrounded)
+FFMPEG = ["ffmpeg", "-hide_banner", "-nostdin", "-loglevel", "error", "-stats", "-y"]
+
+_PPTX_LOCK = threading.Lock()
+
+@lru_cache(maxsize=4)
+def _load_pptx(path: str, mtime: float, size: int) -> Presentation:
+    """Parse a PPTX once per (path, mtime, size) and share it between passes"""
+    return Presentation(path)
+
+def load_presentation(path: str) -> Presentation:
+    """Load a PPTX, reusing the parsed deck while the file is unchanged"""
+    stat = os.stat(path)
+    return _load_pptx(os.path.abspath(path), stat.st_mtime, stat.st_size)
+
+@dataclass(frozen=True)
+class SlideText:
+    """Text pulled out of one PPTX slide"""
+    title: str
+    content: str
+    notes: str
+
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_P_TXBODY = "{http://schemas.openxmlformats.org/presentationml/2006/main}txBody"
+
+def _txbody_text(tx_body) -> str:
+    """Text of a shape's txBody element, read straight from the XML
+    
+    Going through shape.text builds TextFrame, paragraph and run proxies for
+    every shape; the elements already hold the text.
+    """
+    paragraphs = []
+    for paragraph in tx_body.iterchildren(f"{_A}p"):
+        parts = []
+        for child in paragraph:
+            if child.tag == f"{_A}br":
+                parts.append("\n")
+            elif child.tag in (f"{_A}r", f"{_A}fld"):
+                text = child.findtext(f"{_A}t")
+                if text:
+                    parts.append(text)
+        paragraphs.append("".join(parts))
+    return "\n".join(paragraphs)
+
+def read_slide_text(slide) -> SlideText:
+    """Read a slide's title, body and notes in a single walk over its shapes"""
+    title_shape = slide.shapes.title
+    title_element = title_shape.element if title_shape is not None else None
+    title = ''
+    content_parts = []
+    for shape in slide.shapes:
+        tx_body = shape.element.find(_P_TXBODY)
+        if tx_body is None:
+            continue
+        text = _txbody_text(tx_body).strip()
+        if shape.element is title_element:
+            title = text
+        elif text:
+            content_parts.append(text)
+    
+    notes = ''
+    if slide.has_notes_slide:
+        notes_frame = slide.notes_slide.notes_text_frame
+        if notes_frame:
+            notes = notes_frame.text.strip()
+    
+    return SlideText(title, '\n'.join(content_parts), notes)
+
+@lru_cache(maxsize=4)
+def _load_slide_texts(path: str, mtime: float, size: int) -> Tuple[SlideText, ...]:
+    """Walk every slide of a PPTX once per (path, mtime, size)"""
+    return tuple(read_slide_text(slide) for slide in _load_pptx(path, mtime, size).slides)
+
+def load_slide_texts(path: str) -> Tuple[SlideText, ...]:
+    """Text of every slide, shared by narration extraction and slide rendering"""
+    stat = os.stat(path)
+    # Extraction and rendering run concurrently; the lock makes the second caller
+    # wait for the first parse instead of parsing the deck again
+    with _PPTX_LOCK:
+        return _load_slide_texts(os.path.abspath(path), stat.st_mtime, stat.st_size)
+
+# PDFium is not thread-safe, so every call into it is serialized
+_PDFIUM_LOCK = threading.Lock()
+
+@lru_cache(maxsize=4)
+def _load_pdf(path: str, mtime: float, size: int):
+    """Open a PDF with PDFium once per (path, mtime, size), held in memory"""
+    return pypdfium2.PdfDocument(Path(path).read_bytes())
+
+def load_pdf_document(path: str):
+    """Load a PDF, reusing the parsed document while the file is unchanged"""
+    stat = os.stat(path)
+    return _load_pdf(os.path.abspath(path), stat.st_mtime, stat.st_size)
+
 # Flask app setup
 app = Flask(__name__)
 CORS(app)
@@ -92,17 +303,30 @@ class EasyConfig:
                 "video": "video",
                 "output": "output",
                 "slide_images": "slide_images",
-                "temp": "temp"
+                "temp": "temp",
+                "cache": "cache"
             },
             "files": {
                 "final_video": "final_presentation_with_slides.mp4"
             },
             "wav2lip": {
                 "path": "Wav2Lip",
-                "checkpoint": "checkpoints/wav2lip_gan.pth"
+                "checkpoint": "checkpoints/wav2lip_gan.pth",
+                "fp16": True  # Run the model under CUDA autocast (GPU only)
             },
             "tts": {
-                "model": "tts_models/en/ljspeech/tacotron2-DDC",
+                # "pyttsx3", "coqui", "piper" or "espeak-ng". The voice picker and
+                # preview use pyttsx3 voices, so the others are opt-in
+                "engine": "pyttsx3",
+                "piper": {
+                    "model": ""  # Path to a Piper .onnx voice, or PIPER_MODEL
+                },
+                "provider": "local",  # "azure_batch" synthesizes all slides in one cloud job
+                "azure": {
+                    "region": "",  # Or AZURE_SPEECH_REGION; the key comes from AZURE_SPEECH_KEY
+                    "voice": "en-US-AvaMultilingualNeural"
+                },
+                "model": "tts_models/en/ljspeech/tacotron2-DDC",  # Coqui model for engine "coqui"
                 "voice": "default",
                 "speed": 1.0,
                 "pitch": 1.0
@@ -111,64 +335,147 @@ class EasyConfig:
                 "fps": 25,
                 "resolution": [1920, 1080],
                 "avatar_size_ratio": 0.25,
-                "avatar_position": "bottom_right"
+                "avatar_position": "bottom_right",  # top_left, top_right, bottom_left or bottom_right
+                "encoder": "auto"
             },
             "processing": {
                 "extract_slide_content": True,
                 "extract_speaker_notes": True,
                 "combine_text_sources": True,
-                "skip_existing": True
+                "skip_existing": True,
+                "parallel_workers": 2  # Concurrent Wav2Lip processes
             },
             "gemini": {
                 "api_key": "",
-                "enabled": False
+                "enabled": False,
+                "max_concurrent_requests": 8
             }
         }
 
 class TTSManager:
     """Simple TTS Manager with pyttsx3 fallback"""
     
+    # pyttsx3 drivers run a single, non-reentrant event loop per process
+    name = "pyttsx3"
+    max_parallel = 1
+    rate = 150
+    
     def __init__(self, config):
         self.config = config
         self.engine = None
+        self._voices = None
+        self._voice_ids = None
+        self._voice_name = None
+        self._start_executor()
         self._init_engine()
     
-    def _init_engine(self):
+    def _start_executor(self):
+        """One reusable thread runs the blocking driver loop so calls can time out"""
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyttsx3")
+        self._finalizer = weakref.finalize(self, self._executor.shutdown, wait=False)
+    
+    def close(self):
+        """Shut down the synthesis thread"""
+        self._finalizer()
+    
+    def _init_engine(self, fresh: bool = False):
         """Initialize TTS engine"""
+        if pyttsx3 is None:
+            logger.error("ERROR: Failed to initialize TTS: pyttsx3 is not installed")
+            self.engine = None
+            return
+        
         try:
-            import pyttsx3
-            self.engine = pyttsx3.init()
-            self.engine.setProperty('rate', 150)
-            self.engine.setProperty('volume', 0.9)
+            # Create the engine on the thread that runs its loop: drivers such as
+            # SAPI5 bind their COM objects to the creating thread
+            self.engine = self._executor.submit(self._create_engine, fresh).result(timeout=30)
+            self._voices = None
+            self._voice_ids = None
             logger.info("SUCCESS: TTS engine initialized with pyttsx3")
+            # A replacement engine starts on the default voice
+            if fresh and self._voice_name:
+                self.set_voice(self._voice_name)
         except Exception as e:
             logger.error(f"ERROR: Failed to initialize TTS: {e}")
             self.engine = None
     
+    def _create_engine(self, fresh: bool = False):
+        """Build the pyttsx3 engine on the synthesis thread"""
+        # pyttsx3.init() returns its cached engine, which is the broken one when
+        # replacing it, so a replacement is built directly
+        engine = pyttsx3.Engine() if fresh else pyttsx3.init()
+        engine.setProperty('rate', self.rate)
+        engine.setProperty('volume', 0.9)
+        return engine
+    
     def reset_engine(self):
         """Reset the TTS engine completely"""
         try:
             if self.engine:
                 self.engine.stop()
-            time.sleep(1)
-            self._init_engine()
+            self.engine = None
+            self._init_engine(fresh=True)
             logger.info("SUCCESS: TTS engine reset")
         except Exception as e:
             logger.error(f"ERROR: Failed to reset TTS engine: {e}")
             self.engine = None
     
+    def _synthesize(self, text: str, output_path: str):
+        """Run one blocking pyttsx3 save on the synthesis thread"""
+        self.engine.save_to_file(text, output_path)
+        self.engine.runAndWait()
+    
+    def _synthesize_preview(self, text: str, output_path: str, voice_id):
+        """Speak a preview in the given voice, then put back the voice the pipeline uses"""
+        saved = {prop: self.engine.getProperty(prop) for prop in ('voice', 'rate', 'volume')}
+        try:
+            if voice_id is not None:
+                self.engine.setProperty('voice', voice_id)
+            self.engine.setProperty('rate', self.rate)
+            self.engine.setProperty('volume', 0.9)
+            self._synthesize(text, output_path)
+        finally:
+            for prop, value in saved.items():
+                self.engine.setProperty(prop, value)
+    
+    def list_voices(self) -> list:
+        """Get the engine's voices, enumerated once on the synthesis thread"""
+        if not self.is_available():
+            return []
+        
+        # Enumerating walks the driver's voice objects (COM on SAPI5), so do it once per engine
+        if self._voices is None:
+            voices = self._executor.submit(self.engine.getProperty, 'voices').result(timeout=30)
+            self._voice_ids = {voice.name: voice.id for voice in voices}
+            self._voices = voices
+        return self._voices
+    
+    def preview(self, text: str, output_path: str, voice_name: str) -> bool:
+        """Generate a voice preview without disturbing the pipeline's voice"""
+        if not self.is_available():
+            logger.error("TTS engine not available")
+            return False
+        
+        self.list_voices()
+        voice_id = self._voice_ids.get(voice_name)
+        if voice_id is None:
+            logger.warning(f"WARNING: Voice '{voice_name}' not found, using default")
+        return self._run_synthesis(output_path, self._synthesize_preview, text, output_path, voice_id)
+    
     def set_voice(self, voice_name: str):
         """Set the TTS voice"""
         if not self.is_available():
             return False
         
         try:
-            voices = self.engine.getProperty('voices')
-            for voice in voices:
-                if voice.name == voice_name:
-                    self.engine.setProperty('voice', voice.id)
-                    logger.info(f"SUCCESS: Voice set to {voice_name}")
-                    return True
+            # Map names to ids once per engine rather than scanning the voices per call
+            self.list_voices()
+            voice_id = self._voice_ids.get(voice_name)
+            if voice_id is not None:
+                self._executor.submit(self.engine.setProperty, 'voice', voice_id).result(timeout=30)
+                self._voice_name = voice_name
+                logger.info(f"SUCCESS: Voice set to {voice_name}")
+                return True
             
             logger.warning(f"WARNING: Voice '{voice_name}' not found, using default")
             return False
@@ -186,57 +493,28 @@ class TTSManager:
             logger.error("TTS engine not available")
             return False
         
+        return self._run_synthesis(output_path, self._synthesize, text, output_path)
+    
+    def _run_synthesis(self, output_path: str, synthesize, *args) -> bool:
+        """Run a synthesis job on the engine's thread with timeout and verify its file"""
         try:
-            # Stop any running operations
+            # Generate audio with timeout; runAndWait() blocks until the file is saved
+            future = self._executor.submit(synthesize, *args)
             try:
-                self.engine.stop()
-            except:
-                pass
-            
-            # Wait a moment for cleanup
-            time.sleep(0.5)
-            
-            # Generate audio with timeout
-            import threading
-            import queue
-            
-            result_queue = queue.Queue()
-            error_queue = queue.Queue()
-            
-            def generate_audio_thread():
-                try:
-                    self.engine.save_to_file(text, output_path)
-                    self.engine.runAndWait()
-                    result_queue.put(True)
-                except Exception as e:
-                    error_queue.put(e)
-            
-            # Start TTS generation in a separate thread
-            tts_thread = threading.Thread(target=generate_audio_thread)
-            tts_thread.daemon = True
-            tts_thread.start()
-            
-            # Wait for completion with timeout
-            tts_thread.join(timeout=30)  # 30 second timeout
-            
-            if tts_thread.is_alive():
+                future.result(timeout=30)  # 30 second timeout
+            except FuturesTimeoutError:
                 logger.error("ERROR: TTS generation timed out after 30 seconds")
-                # Force stop the engine
+                # Force stop the engine and stop queueing behind the hung thread
                 try:
                     self.engine.stop()
-                except:
+                except Exception:
                     pass
+                self.engine = None
+                self._finalizer()
+                self._start_executor()
+                self._init_engine(fresh=True)
                 return False
             
-            # Check for errors
-            if not error_queue.empty():
-                error = error_queue.get()
-                logger.error(f"ERROR: TTS generation failed: {error}")
-                return False
-            
-            # Wait for file to be written
-            time.sleep(1)
-            
             # Verify file was created and has content
             if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
                 logger.info(f"SUCCESS: Generated audio file: {output_path}")
@@ -247,47 +525,387 @@ class TTSManager:
                 
         except Exception as e:
             logger.error(f"ERROR: TTS generation failed: {e}")
-            # Reset the engine completely
+            # Reset the engine completely after a genuine failure
+            self.reset_engine()
+            return False
+
+class SubprocessTTS:
+    """Offline TTS that runs one espeak-ng process per synthesis"""
+    
+    # Every call owns its own process, so slides can be synthesized concurrently
+    name = "espeak-ng"
+    max_parallel = os.cpu_count() or 1
+    rate = 150
+    timeout = 30
+    
+    def __init__(self, config):
+        self.config = config
+        self.executable = shutil.which("espeak-ng") or shutil.which("espeak")
+        self._voices = None
+    
+    def reset_engine(self):
+        """Nothing to reset: no engine state outlives a call"""
+    
+    def _available_voices(self) -> set:
+        """Names and identifiers espeak-ng accepts for -v"""
+        if self._voices is None:
+            result = subprocess.run([self.executable, "--voices"], capture_output=True, text=True, timeout=10)
+            voices = set()
+            for line in result.stdout.splitlines()[1:]:
+                fields = line.split()
+                if len(fields) >= 5:
+                    voices.update((fields[1], fields[3], fields[4]))
+            self._voices = voices
+        return self._voices
+    
+    def set_voice(self, voice_name: str):
+        """Set the TTS voice"""
+        if not self.is_available():
+            return False
+        
+        try:
+            if voice_name in self._available_voices():
+                self.config['voice'] = voice_name
+                logger.info(f"SUCCESS: Voice set to {voice_name}")
+                return True
+            
+            logger.warning(f"WARNING: Voice '{voice_name}' not found, using default")
+            return False
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.error(f"ERROR: Failed to set voice: {e}")
+            return False
+    
+    def is_available(self):
+        """Check if TTS is available"""
+        return self.executable is not None
+    
+    def _command(self, output_path: str) -> List[str]:
+        """Command that reads text on stdin and writes a WAV to output_path"""
+        command = [self.executable, "-s", str(self.rate), "-w", output_path, "--stdin"]
+        voice = self.config.get('voice', 'default')
+        if voice != 'default' and voice in self._available_voices():
+            command[1:1] = ["-v", voice]
+        return command
+    
+    def generate_audio(self, text: str, output_path: str) -> bool:
+        """Generate audio from text with timeout"""
+        if not self.is_available():
+            logger.error("TTS engine not available")
+            return False
+        
+        try:
+            subprocess.run(self._command(output_path), input=text, text=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                           check=True, timeout=self.timeout, close_fds=False)
+        except subprocess.TimeoutExpired:
+            logger.error(f"ERROR: TTS generation timed out after {self.timeout} seconds")
+            return False
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.error(f"ERROR: TTS generation failed: {e}")
+            return False
+        
+        # Verify file was created and has content
+        if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+            logger.info(f"SUCCESS: Generated audio file: {output_path}")
+            return True
+        logger.error(f"ERROR: Audio file not created or empty: {output_path}")
+        return False
+
+class PiperTTS(SubprocessTTS):
+    """Neural offline TTS that runs one Piper process per synthesis"""
+    
+    timeout = 120  # Loading the voice model is part of every call
+    
+    def __init__(self, config):
+        self.config = config
+        self.executable = shutil.which("piper")
+    
+    @property
+    def model(self) -> str:
+        """Voice model path, read from the config shared with per-worker managers"""
+        return self.config.get('piper', {}).get('model') or os.environ.get('PIPER_MODEL', '')
+    
+    @property
+    def name(self) -> str:
+        """Backend name; includes the model so cached narrations are kept per voice"""
+        return f"piper-{Path(self.model).stem}"
+    
+    def set_voice(self, voice_name: str):
+        """Set the TTS voice, which for Piper is a .onnx voice model path"""
+        if voice_name.endswith(".onnx") and os.path.exists(voice_name):
+            self.config.setdefault('piper', {})['model'] = voice_name
+            logger.info(f"SUCCESS: Voice set to {voice_name}")
+            return True
+        
+        logger.warning(f"WARNING: Voice '{voice_name}' is not a Piper model, using {self.model}")
+        return False
+    
+    def is_available(self):
+        """Check if the piper binary and a voice model are present"""
+        return bool(self.executable and self.model and os.path.exists(self.model))
+    
+    def _command(self, output_path: str) -> List[str]:
+        """Command that reads text on stdin and writes a WAV to output_path"""
+        return [self.executable, "--model", self.model, "--output_file", output_path]
+
+class AzureBatchTTS:
+    """Azure batch synthesis: one server-side job synthesizes every slide"""
+    
+    name = "azure_batch"
+    API_VERSION = "2024-04-01"
+    POLL_INTERVAL = 5
+    JOB_TIMEOUT = 1800
+    
+    def __init__(self, config):
+        azure_config = config.get('azure', {})
+        self.key = os.environ.get('AZURE_SPEECH_KEY', '')
+        self.region = azure_config.get('region') or os.environ.get('AZURE_SPEECH_REGION', '')
+        self.voice = azure_config.get('voice', 'en-US-AvaMultilingualNeural')
+    
+    def is_available(self):
+        """Check if credentials for the batch endpoint are configured"""
+        return bool(self.key and self.region)
+    
+    def _request(self, method: str, url: str, payload: Optional[dict] = None) -> dict:
+        """Send one JSON request to the batch synthesis API"""
+        data = json.dumps(payload).encode() if payload is not None else None
+        req = urllib.request.Request(url, data=data, method=method, headers={
+            'Ocp-Apim-Subscription-Key': self.key,
+            'Content-Type': 'application/json'
+        })
+        with urllib.request.urlopen(req, timeout=60) as response:
+            body = response.read()
+        return json.loads(body) if body else {}
+    
+    def synthesize(self, texts: List[str]) -> List[bytes]:
+        """Synthesize all texts in one batch job, returning WAV bytes in input order"""
+        job_url = (f"https://{self.region}.api.cognitive.microsoft.com/texttospeech/batchsyntheses/"
+                   f"{uuid.uuid4()}?api-version={self.API_VERSION}")
+        self._request('PUT', job_url, {
+            'inputKind': 'PlainText',
+            'inputs': [{'content': text} for text in texts],
+            'synthesisConfig': {'voice': self.voice},
+            'properties': {'outputFormat': 'riff-24khz-16bit-mono-pcm'}
+        })
+        logger.info(f"Azure batch synthesis job submitted for {len(texts)} slides")
+        
+        try:
+            deadline = time.monotonic() + self.JOB_TIMEOUT
+            while True:
+                job = self._request('GET', job_url)
+                status = job.get('status')
+                if status == 'Succeeded':
+                    break
+                if status == 'Failed':
+                    raise RuntimeError(f"Azure batch synthesis job failed: {job.get('properties', {}).get('error')}")
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"Azure batch synthesis job still {status} after {self.JOB_TIMEOUT}s")
+                time.sleep(self.POLL_INTERVAL)
+            
+            with urllib.request.urlopen(job['outputs']['result'], timeout=300) as response:
+                archive = zipfile.ZipFile(BytesIO(response.read()))
+        finally:
             try:
-                self.engine.stop()
-                time.sleep(1)
-                self._init_engine()
-            except Exception as reset_error:
-                logger.error(f"ERROR: Failed to reset TTS engine: {reset_error}")
+                self._request('DELETE', job_url)
+            except OSError:
+                pass
+        
+        # Results are numbered by input position (0001.wav, 0002.wav, ...)
+        wav_names = sorted(name for name in archive.namelist() if name.endswith('.wav'))
+        if len(wav_names) != len(texts):
+            raise RuntimeError(f"Azure batch synthesis returned {len(wav_names)} files for {len(texts)} inputs")
+        return [archive.read(name) for name in wav_names]
+
+@lru_cache(maxsize=1)
+def _import_coqui():
+    """Import Coqui TTS and torch on first use, or return None if not installed
+    
+    Unlike the other optional backends this is not imported at module level:
+    loading torch takes seconds and every slide render worker re-imports this
+    module.
+    """
+    try:
+        from TTS.api import TTS
+        import torch
+    except ImportError:
+        return None
+    return TTS, torch
+
+# Sentence ends: punctuation followed by whitespace
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
+class CoquiTTS:
+    """Neural TTS that keeps one Coqui model loaded, on the GPU with FP16 autocast when available"""
+    
+    # One loaded model is shared, so slides queue for it
+    name = "coqui"
+    max_parallel = 1
+    rate = 150
+    SENTENCE_CACHE_SIZE = 256
+    
+    def __init__(self, config):
+        self.config = config
+        self.tts = None
+        self.speaker = None
+        self.use_gpu = False
+        self._lock = threading.Lock()
+        self._sentence_audio = {}  # Recent sentences -> samples, for phrases narrations repeat
+        
+        coqui = _import_coqui()
+        if coqui is None:
+            return
+        TTS, self._torch = coqui
+        try:
+            self.use_gpu = self._torch.cuda.is_available()
+            self.tts = TTS(model_name=config['model'], gpu=self.use_gpu)
+            # Pay for CUDA context creation and kernel selection now, not on the first slide
+            self._synthesize("Hello.")
+            logger.info(f"SUCCESS: Coqui TTS loaded on {'GPU' if self.use_gpu else 'CPU'}")
+        except Exception as e:
+            logger.error(f"ERROR: Failed to load Coqui TTS: {e}")
+            self.tts = None
+    
+    def reset_engine(self):
+        """Nothing to reset: the model holds no per-call state"""
+    
+    def _synthesize(self, text: str) -> np.ndarray:
+        """Run the model on one sentence, in half precision on the GPU"""
+        with self._lock, self._torch.autocast("cuda", dtype=self._torch.float16, enabled=self.use_gpu):
+            return np.asarray(self.tts.tts(text=text, speaker=self.speaker), dtype=np.float32)
+    
+    def _sentence_samples(self, sentence: str) -> np.ndarray:
+        """Samples for one sentence, reusing recent results for the same speaker"""
+        key = (self.speaker, sentence)
+        samples = self._sentence_audio.get(key)
+        if samples is None:
+            samples = self._synthesize(sentence)
+            if len(self._sentence_audio) >= self.SENTENCE_CACHE_SIZE:
+                self._sentence_audio.pop(next(iter(self._sentence_audio)))
+            self._sentence_audio[key] = samples
+        return samples
+    
+    def set_voice(self, voice_name: str):
+        """Set the TTS voice, which for Coqui is a speaker of a multi-speaker model"""
+        if self.is_available() and voice_name in (self.tts.speakers or []):
+            self.speaker = voice_name
+            logger.info(f"SUCCESS: Voice set to {voice_name}")
+            return True
+        
+        logger.warning(f"WARNING: Voice '{voice_name}' not found, using default")
+        return False
+    
+    def is_available(self):
+        """Check if TTS is available"""
+        return self.tts is not None
+    
+    def generate_audio(self, text: str, output_path: str) -> bool:
+        """Generate audio from text"""
+        if not self.is_available():
+            logger.error("TTS engine not available")
             return False
+        
+        # Short sentences keep Tacotron's attention stable and its memory flat on
+        # long notes, and repeated phrases ("Let's move on...") are synthesized once
+        try:
+            sentences = [sentence for sentence in _SENTENCE_END_RE.split(text.strip()) if sentence]
+            samples = np.concatenate([self._sentence_samples(sentence) for sentence in sentences])
+            pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+            with wave.open(output_path, 'wb') as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(self.tts.synthesizer.output_sample_rate)
+                wav_file.writeframes(pcm.tobytes())
+        except Exception as e:
+            logger.error(f"ERROR: TTS generation failed: {e}")
+            return False
+        
+        # Verify file was created and has content
+        if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+            logger.info(f"SUCCESS: Generated audio file: {output_path}")
+            return True
+        logger.error(f"ERROR: Audio file not created or empty: {output_path}")
+        return False
+
+def create_tts_manager(config):
+    """Create the TTS backend selected by config['engine']"""
+    engine = config.get('engine', 'pyttsx3')
+    if engine == 'coqui':
+        # Only on request: the model is a large download and wants a GPU
+        manager = CoquiTTS(config)
+        if manager.is_available():
+            return manager
+        logger.warning("WARNING: Coqui TTS unavailable, falling back to pyttsx3")
+    if engine == 'piper':
+        manager = PiperTTS(config)
+        if manager.is_available():
+            return manager
+        logger.warning("WARNING: piper or its voice model not found, falling back to espeak-ng")
+    if engine in ('piper', 'espeak-ng'):
+        manager = SubprocessTTS(config)
+        if manager.is_available():
+            return manager
+        if engine == 'espeak-ng':
+            logger.warning("WARNING: espeak-ng not found on PATH, falling back to pyttsx3")
+    return TTSManager(config)
+
+# Keywords that pick a narration prefix, matched anywhere in a sentence (as
+# substrings, overlaps included) in one case-insensitive scan
+_NARRATION_KEYWORD_RE = re.compile(r'(?=(system|leverages|uses|can|will))', re.IGNORECASE)
+_NARRATION_PREFIXES = (
+    (("system",), "Let me explain"),
+    (("leverages", "uses"), "Here's how it works"),
+    (("can", "will"), "The key benefits are"),
+)
+
+# Runs of text between sentence-ending punctuation, punctuation left out
+_NARRATION_SENTENCE_RE = re.compile(r'[^.!?]+')
+
+def narration_prefix(sentence: str) -> str:
+    """Pick the explanatory phrase for a sentence from the keywords it mentions"""
+    found = {keyword.lower() for keyword in _NARRATION_KEYWORD_RE.findall(sentence)}
+    if found:
+        for keywords, prefix in _NARRATION_PREFIXES:
+            if not found.isdisjoint(keywords):
+                return prefix
+    return "To elaborate"
 
 class PowerPointProcessor:
     """PowerPoint text extraction with Gemini enhancement"""
     
+    GEMINI_MODEL = 'gemini-pro'
+    
     def __init__(self, config: EasyConfig):
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self._genai_model = None
+        self._genai_key = None
+        self._genai_lock = threading.Lock()
+    
+    def _get_gemini_model(self):
+        """Return the shared Gemini model, rebuilding it only when the API key changes"""
+        api_key = self.config.config['gemini']['api_key']
+        with self._genai_lock:
+            if self._genai_model is None or self._genai_key != api_key:
+                import google.generativeai as genai
+                
+                genai.configure(api_key=api_key)
+                self._genai_model = genai.GenerativeModel(self.GEMINI_MODEL)
+                self._genai_key = api_key
+            return self._genai_model
     
-    def extract_text_from_slide(self, slide) -> Dict[str, str]:
-        """Extract text content from a single slide"""
-        slide_data = {
-            'title': '',
-            'content': '',
-            'speaker_notes': '',
-            'combined_text': ''
+    def extract_text_from_slide(self, slide_text: SlideText) -> Dict[str, str]:
+        """Build the narration source fields for a single slide"""
+        # combined_text is only a narration fallback, so combined_text() builds it on demand
+        return {
+            'title': slide_text.title,
+            'content': slide_text.content,
+            'speaker_notes': slide_text.notes
         }
-        
-        # Extract title
-        if slide.shapes.title:
-            slide_data['title'] = slide.shapes.title.text.strip()
-        
-        # Extract content from text boxes
-        content_parts = []
-        for shape in slide.shapes:
-            if hasattr(shape, "text") and shape.text.strip():
-                if shape != slide.shapes.title:  # Skip title
-                    content_parts.append(shape.text.strip())
-        
-        slide_data['content'] = '\n'.join(content_parts)
-        
-        # Extract speaker notes
-        if slide.has_notes_slide and slide.notes_slide.notes_text_frame:
-            slide_data['speaker_notes'] = slide.notes_slide.notes_text_frame.text.strip()
+    
+    def combined_text(self, slide_data: Dict[str, str]) -> str:
+        """All of a slide's text in one labelled block, unless the slide already carries one"""
+        if 'combined_text' in slide_data:
+            return slide_data['combined_text']
         
         # Combine text intelligently
         combined_parts = []
@@ -298,22 +916,38 @@ class PowerPointProcessor:
         if slide_data['speaker_notes']:
             combined_parts.append(f"Notes: {slide_data['speaker_notes']}")
         
-        slide_data['combined_text'] = '\n\n'.join(combined_parts) if combined_parts else slide_data['speaker_notes'] or slide_data['content']
-        
-        return slide_data
+        return '\n\n'.join(combined_parts) if combined_parts else slide_data['speaker_notes'] or slide_data['content']
     
     def enhance_with_gemini(self, slide_data: Dict[str, str]) -> str:
         """Enhance slide content using Gemini API"""
         if not self.config.config['gemini']['enabled'] or not self.config.config['gemini']['api_key']:
             return self.generate_tutor_explanation(slide_data)
         
+        prompt = self._gemini_prompt(slide_data)
+        
+        # Identical prompts are answered from disk instead of the API
+        prompt_hash = hashlib.sha256(f"{self.GEMINI_MODEL}|{prompt}".encode()).hexdigest()
+        cache_path = Path(self.config.config['directories']['cache']) / 'gemini' / f"{prompt_hash}.txt"
+        if cache_path.exists():
+            return cache_path.read_text(encoding='utf-8')
+        
         try:
-            import google.generativeai as genai
+            response = self._get_gemini_model().generate_content(prompt)
+            narration = response.text.strip()
             
-            genai.configure(api_key=self.config.config['gemini']['api_key'])
-            model = genai.GenerativeModel('gemini-pro')
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(narration, encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+            return narration
             
-            prompt = f"""
+        except Exception as e:
+            self.logger.warning(f"Gemini enhancement failed: {e}, using fallback")
+            return self.generate_tutor_explanation(slide_data)
+    
+    def _gemini_prompt(self, slide_data: Dict[str, str]) -> str:
+        """Build the Gemini narration prompt for a slide"""
+        return f"""
             You are an expert presentation tutor. Create a natural, engaging explanation for this slide content:
             
             Title: {slide_data.get('title', '')}
@@ -328,13 +962,20 @@ class PowerPointProcessor:
             
             Keep it concise but informative. Start with a brief introduction if this is slide 1.
             """
-            
-            response = model.generate_content(prompt)
-            return response.text.strip()
-            
-        except Exception as e:
-            self.logger.warning(f"Gemini enhancement failed: {e}, using fallback")
-            return self.generate_tutor_explanation(slide_data)
+    
+    def enhance_slides(self, slides_data: List[Dict[str, str]]):
+        """Fill in narration_text for every slide, querying Gemini concurrently"""
+        gemini_config = self.config.config['gemini']
+        if gemini_config['enabled'] and gemini_config['api_key'] and len(slides_data) > 1:
+            # Each request is network-bound, so overlap them instead of paying N round trips
+            max_workers = min(gemini_config['max_concurrent_requests'], len(slides_data))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gemini") as executor:
+                narrations = list(executor.map(self.enhance_with_gemini, slides_data))
+        else:
+            narrations = [self.enhance_with_gemini(slide_data) for slide_data in slides_data]
+        
+        for slide_data, narration in zip(slides_data, narrations):
+            slide_data['narration_text'] = narration
     
     def generate_tutor_explanation(self, slide_data: Dict[str, str]) -> str:
         """Generate tutor-style explanation from slide content"""
@@ -355,20 +996,13 @@ class PowerPointProcessor:
         
         # Process content to create explanations
         if content:
-            # Split content into sentences and create explanations
-            sentences = [s.strip() for s in content.split('.') if s.strip()]
+            # Split content into sentences (at . ! or ?) and create explanations
+            sentences = [match.strip() for match in _NARRATION_SENTENCE_RE.findall(content)]
             
             for sentence in sentences:
                 if len(sentence) > 10:  # Only process substantial sentences
                     # Add explanatory phrases
-                    if 'system' in sentence.lower():
-                        explanation_parts.append(f"Let me explain: {sentence}")
-                    elif 'leverages' in sentence.lower() or 'uses' in sentence.lower():
-                        explanation_parts.append(f"Here's how it works: {sentence}")
-                    elif 'can' in sentence.lower() or 'will' in sentence.lower():
-                        explanation_parts.append(f"The key benefits are: {sentence}")
-                    else:
-                        explanation_parts.append(f"To elaborate: {sentence}")
+                    explanation_parts.append(f"{narration_prefix(sentence)}: {sentence}")
         
         # Add notes if available
         if notes and len(notes) > 20:
@@ -376,7 +1010,7 @@ class PowerPointProcessor:
         
         # If no good content, fall back to original text
         if not explanation_parts:
-            return slide_data['combined_text']
+            return self.combined_text(slide_data)
         
         # Join with natural transitions
         explanation = '. '.join(explanation_parts)
@@ -390,21 +1024,20 @@ class PowerPointProcessor:
         self.logger.info(f"Extracting text from {pptx_path}...")
         
         try:
-            prs = Presentation(pptx_path)
             slides_data = []
             
-            for i, slide in enumerate(prs.slides):
-                slide_data = self.extract_text_from_slide(slide)
+            for i, slide_text in enumerate(load_slide_texts(pptx_path)):
+                slide_data = self.extract_text_from_slide(slide_text)
                 slide_data['slide_number'] = i + 1
                 
-                # Generate enhanced explanation
-                slide_data['narration_text'] = self.enhance_with_gemini(slide_data)
-                
                 slides_data.append(slide_data)
                 
                 title_preview = slide_data.get('title', 'No title')[:50]
                 self.logger.info(f"   -> Slide {i+1}: '{title_preview}...'")
             
+            # Generate enhanced explanations
+            self.enhance_slides(slides_data)
+            
             self.logger.info(f"SUCCESS: Extracted text from {len(slides_data)} slides")
             return slides_data
             
@@ -417,30 +1050,23 @@ class PowerPointProcessor:
         self.logger.info(f"Extracting text from {pdf_path}...")
         
         try:
-            import PyPDF2
-            
             slides_data = []
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
+            for i, text in enumerate(self._extract_pdf_page_texts(pdf_path)):
+                slide_data = {
+                    'title': f'Page {i + 1}',
+                    'content': text,
+                    'speaker_notes': '',
+                    'combined_text': text,
+                    'slide_number': i + 1
+                }
                 
-                for i, page in enumerate(pdf_reader.pages):
-                    text = page.extract_text()
-                    
-                    slide_data = {
-                        'title': f'Page {i + 1}',
-                        'content': text,
-                        'speaker_notes': '',
-                        'combined_text': text,
-                        'slide_number': i + 1
-                    }
-                    
-                    # Generate enhanced explanation
-                    slide_data['narration_text'] = self.enhance_with_gemini(slide_data)
-                    
-                    slides_data.append(slide_data)
-                    
-                    content_preview = text[:50] if text else 'No content'
-                    self.logger.info(f"   -> Page {i+1}: '{content_preview}...'")
+                slides_data.append(slide_data)
+                
+                content_preview = text[:50] if text else 'No content'
+                self.logger.info(f"   -> Page {i+1}: '{content_preview}...'")
+            
+            # Generate enhanced explanations
+            self.enhance_slides(slides_data)
             
             self.logger.info(f"SUCCESS: Extracted text from {len(slides_data)} pages")
             return slides_data
@@ -449,6 +1075,25 @@ class PowerPointProcessor:
             self.logger.error(f"ERROR: Reading PDF file: {e}")
             return []
     
+    def _extract_pdf_page_texts(self, pdf_path: str) -> List[str]:
+        """Extract the text of every PDF page, with PDFium when available"""
+        if pypdfium2 is not None:
+            page_texts = []
+            with _PDFIUM_LOCK:
+                for page in load_pdf_document(pdf_path):
+                    textpage = page.get_textpage()
+                    page_texts.append(textpage.get_text_range())
+                    textpage.close()
+                    page.close()
+            return page_texts
+        
+        if PyPDF2 is None:
+            raise ImportError("PyPDF2 or pypdfium2 is required to read PDF files")
+        
+        with open(pdf_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            return [page.extract_text() for page in pdf_reader.pages]
+    
     def extract_slides_from_file(self, file_path: str) -> List[Dict[str, str]]:
         """Extract slides from either PPTX or PDF file"""
         file_ext = os.path.splitext(file_path)[1].lower()
@@ -461,6 +1106,35 @@ class PowerPointProcessor:
             self.logger.error(f"ERROR: Unsupported file format: {file_ext}")
             return []
 
+def save_png(image: Image.Image, output_path: str):
+    """Write a slide image as a fast-compressed PNG, with libspng when installed"""
+    if pyspng is not None:
+        Path(output_path).write_bytes(pyspng.encode(np.asarray(image), compress_level=1))
+    else:
+        # Fast zlib level: encoding dominates rendering and size barely matters here
+        image.save(output_path, 'PNG', compress_level=1)
+
+@lru_cache(maxsize=32)
+def load_font(path: str, size: int):
+    """Load a TrueType font once per process, falling back to PIL's default font"""
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+@lru_cache(maxsize=32)
+def font_advance_table(font) -> np.ndarray:
+    """Measure the advance width of every ASCII character once per font, indexed by code"""
+    space_width = font.getlength(' ')
+    return np.array([font.getlength(chr(code)) if chr(code).isprintable() else space_width
+                     for code in range(128)], dtype=np.float32)
+
+def word_widths(words: List[str], advance: np.ndarray) -> np.ndarray:
+    """Sum the glyph advances of every ASCII word in one vectorized pass"""
+    codes = np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8)
+    starts = np.cumsum([0] + [len(word) for word in words[:-1]])
+    return np.add.reduceat(advance[codes], starts)
+
 class SlideRenderer:
     """Enhanced slide renderer for PowerPoint presentations"""
     
@@ -469,131 +1143,182 @@ class SlideRenderer:
         self.height = height
         self.logger = logging.getLogger(__name__)
         
-        # Try to load a system font
-        try:
-            self.title_font = ImageFont.truetype("arial.ttf", 48)
-            self.content_font = ImageFont.truetype("arial.ttf", 32)
-            self.notes_font = ImageFont.truetype("arial.ttf", 24)
-        except:
-            # Fallback to default font
-            self.title_font = ImageFont.load_default()
-            self.content_font = ImageFont.load_default()
-            self.notes_font = ImageFont.load_default()
+        # Try to load a system font; fonts are shared by every renderer in the process
+        self.title_font = load_font("arial.ttf", 48)
+        self.content_font = load_font("arial.ttf", 32)
+        self.notes_font = load_font("arial.ttf", 24)
+        
+        # Layout areas depend only on the slide size, so work them out once
+        margin = 50
+        self.title_area = (margin, margin, self.width - margin, 150)
+        self.content_area = (margin, 180, self.width - margin, self.height - 200)
+        self.notes_area = (margin, self.height - 150, self.width - margin, self.height - margin)
+        self.slide_number_xy = (self.width - 100, 20)
+        self.notes_separator = [margin, self.height - 160, self.width - margin, self.height - 160]
+        
+        # One canvas is blanked and redrawn for every slide instead of allocating a new one
+        self._canvas = Image.new('RGB', (self.width, self.height), 'white')
+        self._draw = ImageDraw.Draw(self._canvas)
     
     def render_slide(self, slide, slide_number: int) -> Image.Image:
         """Render a single slide as an image"""
-        # Create a new image with white background
-        img = Image.new('RGB', (self.width, self.height), 'white')
-        draw = ImageDraw.Draw(img)
-        
-        # Define layout areas
-        margin = 50
-        title_area = (margin, margin, self.width - margin, 150)
-        content_area = (margin, 180, self.width - margin, self.height - 200)
-        notes_area = (margin, self.height - 150, self.width - margin, self.height - margin)
+        return self.render_slide_text(read_slide_text(slide), slide_number).copy()
+    
+    def render_slide_text(self, slide_text: SlideText, slide_number: int) -> Image.Image:
+        """Render a slide onto the shared canvas; it is overwritten by the next render"""
+        # Blank the reused canvas to a white background
+        draw = self._draw
+        draw.rectangle((0, 0, self.width, self.height), fill='white')
         
         # Draw slide number
-        draw.text((self.width - 100, 20), f"Slide {slide_number}", 
+        draw.text(self.slide_number_xy, f"Slide {slide_number}", 
                  fill='gray', font=self.content_font)
         
-        # Extract and render title
-        if slide.shapes.title and slide.shapes.title.text.strip():
-            title_text = slide.shapes.title.text.strip()
-            self._draw_wrapped_text(draw, title_text, title_area, self.title_font, 'black')
-        
-        # Extract and render content
-        content_text = self._extract_slide_content(slide)
-        if content_text:
-            self._draw_wrapped_text(draw, content_text, content_area, self.content_font, 'black')
+        # Render title
+        if slide_text.title:
+            self._draw_wrapped_text(draw, slide_text.title, self.title_area, self.title_font, 'black')
         
-        # Extract and render speaker notes
-        if slide.has_notes_slide and slide.notes_slide.notes_text_frame:
-            notes_text = slide.notes_slide.notes_text_frame.text.strip()
-            if notes_text:
-                # Draw a separator line
-                draw.line([margin, self.height - 160, self.width - margin, self.height - 160], 
-                         fill='lightgray', width=2)
-                self._draw_wrapped_text(draw, f"Notes: {notes_text}", notes_area, 
-                                      self.notes_font, 'darkgray')
-        
-        return img
-    
-    def _extract_slide_content(self, slide) -> str:
-        """Extract all text content from slide shapes"""
-        content_parts = []
+        # Render content
+        if slide_text.content:
+            self._draw_wrapped_text(draw, slide_text.content, self.content_area, self.content_font, 'black')
         
-        for shape in slide.shapes:
-            if hasattr(shape, "text") and shape.text.strip():
-                # Skip the title shape
-                if shape != slide.shapes.title:
-                    content_parts.append(shape.text.strip())
+        # Render speaker notes
+        if slide_text.notes:
+            # Draw a separator line
+            draw.line(self.notes_separator, fill='lightgray', width=2)
+            self._draw_wrapped_text(draw, f"Notes: {slide_text.notes}", self.notes_area, 
+                                  self.notes_font, 'darkgray')
         
-        return '\n'.join(content_parts)
+        return self._canvas
     
     def _draw_wrapped_text(self, draw, text: str, area: tuple, font, color: str):
         """Draw text with word wrapping within the specified area"""
         x, y, max_x, max_y = area
+        max_width = max_x - x
+        # Per-font glyph advances so wrapping needs no FreeType call per word
+        advance = font_advance_table(font)
+        space_width = float(advance[ord(' ')])
         words = text.split()
+        if not words:
+            return
+        
+        if text.isascii():
+            widths = word_widths(words, advance).tolist()
+        else:
+            # The table only covers ASCII, so let FreeType measure the rest;
+            # textlength returns just the advance, without textbbox's extents
+            widths = [float(word_widths([word], advance)[0]) if word.isascii()
+                      else draw.textlength(word, font=font) for word in words]
+        
         lines = []
         current_line = []
+        line_width = 0
         
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            bbox = draw.textbbox((0, 0), test_line, font=font)
-            text_width = bbox[2] - bbox[0]
-            
-            if text_width <= max_x - x:
+        for word, word_width in zip(words, widths):
+            test_width = line_width + space_width + word_width if current_line else word_width
+            if test_width <= max_width:
                 current_line.append(word)
+                line_width = test_width
             else:
                 if current_line:
                     lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    # Single word is too long, add it anyway
-                    lines.append(word)
+                # A single word that is too long still gets its own line
+                current_line = [word]
+                line_width = word_width
         
         if current_line:
             lines.append(' '.join(current_line))
         
         # Draw the lines
-        line_height = 40  # Approximate line height
+        if hasattr(font, 'getmetrics'):
+            ascent, descent = font.getmetrics()
+            line_height = ascent + descent
+        else:
+            line_height = 40  # Approximate line height for bitmap fonts
         for i, line in enumerate(lines):
             line_y = y + (i * line_height)
             if line_y + line_height <= max_y:
                 draw.text((x, line_y), line, fill=color, font=font)
     
-    def render_presentation(self, file_path: str, output_dir: str) -> List[str]:
-        """Render all slides from a presentation (PPTX or PDF)"""
+    def render_presentation(self, file_path: str, output_dir: str, skip_existing: bool = True) -> List[str]:
+        """Render all slides from a presentation (PPTX or PDF), reusing unchanged ones if skip_existing"""
         self.logger.info(f"Rendering slides from {file_path}")
         
         try:
             file_ext = os.path.splitext(file_path)[1].lower()
             slide_images = []
             
+            # Re-uploading the same deck reuses the slides rendered from it last time
+            source_key = f"{file_digest(file_path)}|{self.width}x{self.height}"
+            cached_images = self._cached_render(output_dir, source_key) if skip_existing else None
+            if cached_images:
+                self.logger.info(f"SKIP: {len(cached_images)} slides already rendered from this file")
+                return cached_images
+            
             if file_ext == '.pptx':
                 # Handle PowerPoint files
-                prs = Presentation(file_path)
+                slide_texts = load_slide_texts(file_path)
+                slide_count = len(slide_texts)
                 
-                for i, slide in enumerate(prs.slides):
-                    slide_image = self.render_slide(slide, i + 1)
-                    output_path = os.path.join(output_dir, f"slide_{i+1:03d}.png")
-                    slide_image.save(output_path)
-                    slide_images.append(output_path)
-                    self.logger.info(f"   -> Rendered slide {i+1}")
+                # Prefer LibreOffice's rendering of the real slide design. Pages are
+                # rasterized next to the PDF and only replace the slide images once
+                # they are known to line up, so a mismatch leaves output_dir (and the
+                # drawn slides' .hash sidecars) untouched
+                with tempfile.TemporaryDirectory() as pdf_dir:
+                    pdf_path = self._pptx_to_pdf(file_path, pdf_dir)
+                    if pdf_path:
+                        try:
+                            slide_images = self._render_pdf_pages(pdf_path, pdf_dir)
+                        except Exception as e:
+                            self.logger.warning(f"WARNING: Rasterizing converted PDF failed: {e}")
                     
-            elif file_ext == '.pdf':
-                # Handle PDF files
-                from pdf2image import convert_from_path
+                    if slide_images and len(slide_images) == slide_count:
+                        pages = slide_images
+                        slide_images = []
+                        for page_path in pages:
+                            output_path = os.path.join(output_dir, os.path.basename(page_path))
+                            shutil.move(page_path, output_path)
+                            slide_images.append(output_path)
+                        self._record_render(output_dir, source_key, slide_images)
+                        self.logger.info(f"SUCCESS: Rendered {len(slide_images)} slides")
+                        return slide_images
                 
-                pages = convert_from_path(file_path, dpi=300)
+                if slide_images:
+                    # Hidden slides are left out of the PDF, which would misalign narration
+                    self.logger.warning(f"WARNING: PDF export has {len(slide_images)} pages for "
+                                        f"{slide_count} slides, drawing slides instead")
+                    slide_images = []
                 
-                for i, page in enumerate(pages):
-                    # Resize to our standard resolution
-                    page = page.resize((self.width, self.height), Image.Resampling.LANCZOS)
-                    output_path = os.path.join(output_dir, f"slide_{i+1:03d}.png")
-                    page.save(output_path)
-                    slide_images.append(output_path)
-                    self.logger.info(f"   -> Rendered page {i+1}")
+                # Text comes from the shared per-deck walk; drawing, PNG encoding and
+                # writing run on all cores, so only paths come back from the workers.
+                # A drawn slide depends only on its text, so unchanged slides are kept
+                rendered = {}
+                slide_keys = {}
+                tasks = []
+                for i, slide_text in enumerate(slide_texts):
+                    output_path = os.path.join(output_dir, f"slide_{i + 1:03d}.png")
+                    key = hashlib.blake2b(repr((self.width, self.height, i + 1, slide_text)).encode(),
+                                          digest_size=16).hexdigest()
+                    if skip_existing and self._sidecar_matches(output_path, key):
+                        rendered[i + 1] = output_path
+                    else:
+                        slide_keys[i + 1] = key
+                        tasks.append((self.width, self.height, i + 1, slide_text, output_path))
+                
+                for slide_number, output_path in self._render_tasks(tasks):
+                    Path(f"{output_path}.hash").write_text(slide_keys[slide_number])
+                    rendered[slide_number] = output_path
+                    self.logger.info(f"   -> Rendered slide {slide_number}")
+                if len(rendered) > len(tasks):
+                    self.logger.info(f"SKIP: {len(rendered) - len(tasks)} unchanged slides")
+                slide_images = [rendered[slide_number] for slide_number in sorted(rendered)]
+                self._record_render(output_dir, source_key, slide_images, drawn=True)
+                    
+            elif file_ext == '.pdf':
+                # Handle PDF files
+                slide_images = self._render_pdf_pages(file_path, output_dir)
+                if slide_images:
+                    self._record_render(output_dir, source_key, slide_images)
             
             self.logger.info(f"SUCCESS: Rendered {len(slide_images)} slides")
             return slide_images
@@ -601,6 +1326,194 @@ class SlideRenderer:
         except Exception as e:
             self.logger.error(f"ERROR: Rendering slides: {e}")
             return []
+    
+    @staticmethod
+    def _sidecar_matches(image_path: str, key: str) -> bool:
+        """Check that an image exists and its .hash sidecar records key"""
+        try:
+            return os.path.getsize(image_path) > 0 and Path(f"{image_path}.hash").read_text() == key
+        except OSError:
+            return False
+    
+    @staticmethod
+    def _cached_render(output_dir: str, source_key: str) -> Optional[List[str]]:
+        """Slide images recorded for this exact source file, if they are all still there"""
+        try:
+            record = json.loads(Path(output_dir, "render.json").read_text())
+        except (OSError, ValueError):
+            return None
+        images = record.get("images", [])
+        if record.get("source") != source_key or not images:
+            return None
+        if not all(os.path.exists(path) and os.path.getsize(path) > 0 for path in images):
+            return None
+        return images
+    
+    @staticmethod
+    def _record_render(output_dir: str, source_key: str, slide_images: List[str], drawn: bool = False):
+        """Remember which source file the slide images were rendered from"""
+        if not drawn:
+            # The images no longer match what a per-slide sidecar says was drawn there
+            for path in slide_images:
+                Path(f"{path}.hash").unlink(missing_ok=True)
+        Path(output_dir, "render.json").write_text(json.dumps({"source": source_key, "images": slide_images}))
+    
+    def _render_pdf_pages(self, pdf_path: str, output_dir: str) -> List[str]:
+        """Rasterize every PDF page to a slide image"""
+        if pypdfium2 is not None:
+            return self._render_pdf_pages_pdfium(pdf_path, output_dir)
+        if convert_from_path is None:
+            raise ImportError("pdf2image or pypdfium2 is required to render PDF pages")
+        
+        slide_images = []
+        # Let poppler rasterize straight to the slide size, one thread per core,
+        # instead of rendering at 300 dpi and downscaling afterwards
+        pages = convert_from_path(pdf_path, size=(self.width, self.height),
+                                  thread_count=os.cpu_count() or 1)
+        
+        # PNG compression releases the GIL, so pages are encoded side by side
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="png") as executor:
+            saves = []
+            for i, page in enumerate(pages):
+                # Resize to our standard resolution if poppler rounded the size
+                if page.size != (self.width, self.height):
+                    page = page.resize((self.width, self.height), Image.Resampling.BILINEAR)
+                output_path = os.path.join(output_dir, f"slide_{i+1:03d}.png")
+                saves.append(executor.submit(save_png, page, output_path))
+                slide_images.append(output_path)
+            
+            for i, save in enumerate(saves):
+                save.result()
+                self.logger.info(f"   -> Rendered page {i+1}")
+        
+        return slide_images
+    
+    def _render_pdf_pages_pdfium(self, pdf_path: str, output_dir: str) -> List[str]:
+        """Rasterize PDF pages in-process from the shared PDFium document"""
+        slide_images = []
+        # PDFium renders one page at a time; PNG encoding releases the GIL, so
+        # finished pages are written by a pool while the next one renders
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="png") as executor:
+            saves = []
+            with _PDFIUM_LOCK:
+                for i, page in enumerate(load_pdf_document(pdf_path)):
+                    page_image = page.render(scale=self.width / page.get_width()).to_pil()
+                    page.close()
+                    
+                    # Stretch to our standard resolution like the pdf2image path
+                    if page_image.size != (self.width, self.height):
+                        page_image = page_image.resize((self.width, self.height), Image.Resampling.BILINEAR)
+                    output_path = os.path.join(output_dir, f"slide_{i+1:03d}.png")
+                    saves.append(executor.submit(save_png, page_image, output_path))
+                    slide_images.append(output_path)
+            
+            for i, save in enumerate(saves):
+                save.result()
+                self.logger.info(f"   -> Rendered page {i+1}")
+        
+        return slide_images
+    
+    def _pptx_to_pdf(self, pptx_path: str, output_dir: str) -> Optional[str]:
+        """Convert a PPTX to PDF with headless LibreOffice, or None if unavailable"""
+        soffice = shutil.which("soffice") or shutil.which("libreoffice")
+        if not soffice:
+            self.logger.info("LibreOffice not found, drawing slides from their text")
+            return None
+        
+        # A dedicated profile keeps a running desktop LibreOffice from swallowing the
+        # request, and reusing it skips first-start profile setup on later runs
+        profile = Path(tempfile.gettempdir(), "avatar_soffice_profile").as_uri()
+        try:
+            subprocess.run([soffice, f"-env:UserInstallation={profile}", "--headless",
+                            "--convert-to", "pdf", "--outdir", output_dir, pptx_path],
+                           check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=300)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            self.logger.warning(f"WARNING: LibreOffice conversion failed: {e}")
+            return None
+        
+        pdf_path = os.path.join(output_dir, f"{Path(pptx_path).stem}.pdf")
+        return pdf_path if os.path.exists(pdf_path) else None
+    
+    def _render_tasks(self, tasks: List[tuple]) -> List[Tuple[int, str]]:
+        """Render slide tasks in worker processes, falling back to this process"""
+        if len(tasks) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(tasks))) as executor:
+                    return list(executor.map(_render_slide_file, tasks, chunksize=4))
+            except (OSError, BrokenProcessPool) as e:
+                self.logger.warning(f"WARNING: Parallel slide rendering unavailable, rendering serially: {e}")
+        return [_render_slide_file(task) for task in tasks]
+
+@lru_cache(maxsize=2)
+def _process_slide_renderer(width: int, height: int) -> SlideRenderer:
+    """One renderer (and its loaded fonts) per worker process and size"""
+    return SlideRenderer(width, height)
+
+def _render_slide_file(task: tuple) -> Tuple[int, str]:
+    """Render one slide from picklable text inputs and write it as a PNG"""
+    width, height, slide_number, slide_text, output_path = task
+    renderer = _process_slide_renderer(width, height)
+    slide_image = renderer.render_slide_text(slide_text, slide_number)
+    save_png(slide_image, output_path)
+    return slide_number, output_path
+
+def link_or_copy(src: str, dst: str):
+    """Hardlink src to dst (copying across filesystems), replacing dst atomically"""
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    tmp_path = f"{dst}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+def file_digest(path: str) -> str:
+    """Short BLAKE2b digest of a file's contents"""
+    digest = hashlib.blake2b(digest_size=8)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def audio_duration(path: str) -> Optional[float]:
+    """Get an audio file's duration from its header, falling back to ffprobe"""
+    if sf is not None:
+        try:
+            return sf.info(path).duration
+        except (RuntimeError, OSError):
+            pass
+    if path.endswith('.wav'):
+        # Every local engine writes PCM WAV, whose header the stdlib reads without spawning ffprobe
+        try:
+            with wave.open(path, 'rb') as wav_file:
+                return wav_file.getnframes() / wav_file.getframerate()
+        except (wave.Error, EOFError, OSError, ZeroDivisionError):
+            pass
+    return probe_duration(path)
+
+_DIGITS_RE = re.compile(r'(\d+)')
+
+def natural_sort_key(name: str) -> List:
+    """Sort key that orders embedded numbers numerically (slide_9 before slide_10)"""
+    return [int(part) if part.isdigit() else part for part in _DIGITS_RE.split(name)]
+
+def list_nonempty_files(directory: str, suffix: str) -> List[str]:
+    """List non-empty files in a directory ending with suffix, in natural name order"""
+    if not os.path.isdir(directory):
+        return []
+    with os.scandir(directory) as entries:
+        candidates = [entry for entry in entries if entry.name.endswith(suffix) and entry.is_file()]
+    
+    # Each stat is a round trip on network mounts, so overlap them
+    if len(candidates) > 1:
+        with ThreadPoolExecutor(max_workers=min(16, len(candidates))) as executor:
+            sizes = list(executor.map(lambda entry: entry.stat().st_size, candidates))
+    else:
+        sizes = [entry.stat().st_size for entry in candidates]
+    matches = [entry for entry, size in zip(candidates, sizes) if size > 0]
+    return [entry.path for entry in sorted(matches, key=lambda entry: natural_sort_key(entry.name))]
 
 class TTSProcessor:
     """TTS processor with fallback support"""
@@ -608,17 +1521,34 @@ class TTSProcessor:
     def __init__(self, config: EasyConfig):
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.tts_manager = TTSManager(self.config.config['tts'])
+        self.tts_manager = create_tts_manager(self.config.config['tts'])
+        self.cloud_tts = (AzureBatchTTS(self.config.config['tts'])
+                          if self.config.config['tts'].get('provider') == 'azure_batch' else None)
         self.system_instance = None  # Will be set by the main system
+        self._local = threading.local()  # Per-worker TTS managers
+        self.audio_durations = {}  # Seconds of narration per slide file name (e.g. 'slide_001')
+    
+    def _worker_tts(self):
+        """Get the TTS manager owned by the current worker thread"""
+        if self.tts_manager.max_parallel == 1:
+            # Engines that cannot run concurrently are shared by the single worker
+            return self.tts_manager
+        
+        manager = getattr(self._local, 'tts_manager', None)
+        if manager is None:
+            manager = create_tts_manager(self.config.config['tts'])
+            self._local.tts_manager = manager
+        return manager
     
     def generate_audio(self, text: str, output_path: str) -> bool:
         """Generate audio from text"""
-        if not self.tts_manager.is_available():
+        tts_manager = self._worker_tts()
+        if not tts_manager.is_available():
             self.logger.error("No TTS system available")
             return False
         
         try:
-            success = self.tts_manager.generate_audio(text, output_path)
+            success = tts_manager.generate_audio(text, output_path)
             if success:
                 self.logger.info(f"SUCCESS: Generated audio: {output_path}")
             return success
@@ -635,95 +1565,252 @@ class TTSProcessor:
         if self.system_instance:
             self.system_instance.processing_status['progress'] = progress
             self.system_instance.processing_status['current_step'] = current_step
-            # Show status update prominently in terminal
-            print(f"\n🔄 STATUS UPDATE: {progress}% - {current_step}")
-            self.logger.info(f"Status updated: {progress}% - {current_step}")
+            # Printing and logging happen on the system's status thread
+            self.system_instance.status_queue.put((progress, current_step))
+    
+    def _narration_cache_path(self, text: str) -> str:
+        """Content-addressed cache path for a narration rendered with the current voice"""
+        tts_config = self.config.config['tts']
+        key = hashlib.sha256(
+            f"{text}|{self.tts_manager.name}|{tts_config['voice']}|{self.tts_manager.rate}|{tts_config['model']}".encode()
+        ).hexdigest()
+        return os.path.join(self.config.config['directories']['cache'], 'tts', key[:2], f"{key}.wav")
+    
+    def _generate_slide_audio(self, slide_data: Dict, output_dir: str, total_slides: int, progress: int) -> Optional[str]:
+        """Generate audio for one slide with retries, returning the audio path or None"""
+        slide_num = slide_data['slide_number']
+        text = slide_data['narration_text']  # Use enhanced explanation
+        
+        print(f"\n🎵 PROCESSING SLIDE {slide_num}/{total_slides} - Generating audio...")
+        self.logger.info(f"Processing slide {slide_num}/{total_slides} (Progress: {progress}%)")
+        
+        if not text.strip():
+            self.logger.warning(f"WARNING: No text found for slide {slide_num}, skipping")
+            return None
+        
+        output_path = os.path.join(output_dir, f"slide_{slide_num:03d}.wav")
+        
+        # Skip if file exists and skip_existing is enabled
+        if (os.path.exists(output_path) and 
+            self.config.config['processing']['skip_existing'] and
+            os.path.getsize(output_path) > 0):
+            self.logger.info(f"SKIP: Slide {slide_num}, audio already exists")
+            return output_path
+        
+        # Identical narration with the same voice was synthesized before
+        cache_path = self._narration_cache_path(text)
+        if os.path.exists(cache_path) and os.path.getsize(cache_path) > 0:
+            link_or_copy(cache_path, output_path)
+            self.logger.info(f"SKIP: Slide {slide_num}, audio restored from cache")
+            return output_path
+        
+        # Never synthesize into a file that may be hardlinked to a cache entry
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        
+        # Try to generate audio with retry logic
+        max_retries = 3
+        
+        for attempt in range(max_retries):
+            current_step = f"Generating audio for slide {slide_num}/{total_slides} (attempt {attempt + 1}/{max_retries})"
+            print(f"🔄 ATTEMPT {attempt + 1}/{max_retries} for slide {slide_num}")
+            self.logger.info(f"Generating audio for slide {slide_num} (attempt {attempt + 1}/{max_retries})")
+            self.update_status(progress, current_step)
+            
+            if self.generate_audio(text, output_path):
+                print(f"✅ AUDIO GENERATED FOR SLIDE {slide_num}/{total_slides}")
+                self.logger.info(f"SUCCESS: Audio generated for slide {slide_num}")
+                try:
+                    link_or_copy(output_path, cache_path)
+                except OSError as e:
+                    self.logger.warning(f"WARNING: Could not cache audio for slide {slide_num}: {e}")
+                return output_path
+            
+            print(f"❌ ATTEMPT {attempt + 1} FAILED for slide {slide_num}")
+            self.logger.warning(f"Attempt {attempt + 1} failed for slide {slide_num}")
+            if attempt < max_retries - 1:
+                # Reset engine between retries
+                print(f"🔄 Resetting TTS engine before retry {attempt + 2}")
+                self.logger.info(f"Resetting TTS engine before retry {attempt + 2}")
+                self._worker_tts().reset_engine()
+        
+        print(f"❌ FAILED TO GENERATE AUDIO FOR SLIDE {slide_num} after {max_retries} attempts - SKIPPING")
+        self.logger.error(f"ERROR: Failed to generate audio for slide {slide_num} after {max_retries} attempts")
+        return None
+    
+    def _generate_cloud_batch(self, slides_data: List[Dict], output_dir: str) -> Dict[int, str]:
+        """Synthesize slides with the cloud batch provider, returning audio paths by slide number"""
+        skip_existing = self.config.config['processing']['skip_existing']
+        pending = []
+        for slide_data in slides_data:
+            text = slide_data['narration_text']
+            output_path = os.path.join(output_dir, f"slide_{slide_data['slide_number']:03d}.wav")
+            if not text.strip():
+                continue
+            if skip_existing and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+                continue
+            pending.append((slide_data['slide_number'], text, output_path))
+        
+        if not pending:
+            return {}
+        if not self.cloud_tts.is_available():
+            self.logger.warning("WARNING: Azure batch synthesis selected but AZURE_SPEECH_KEY/region are not set")
+            return {}
+        
+        self.update_status(25, f"Synthesizing {len(pending)} slides with Azure batch synthesis")
+        try:
+            wav_files = self.cloud_tts.synthesize([text for _, text, _ in pending])
+        except (OSError, ValueError, KeyError, RuntimeError) as e:
+            self.logger.warning(f"WARNING: Azure batch synthesis failed, using local TTS: {e}")
+            return {}
+        
+        audio_by_slide = {}
+        for (slide_num, _, output_path), wav_bytes in zip(pending, wav_files):
+            # Replace rather than overwrite: the old file may be hardlinked into the cache
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            Path(output_path).write_bytes(wav_bytes)
+            audio_by_slide[slide_num] = output_path
+        
+        self.logger.info(f"SUCCESS: Azure batch synthesis generated {len(audio_by_slide)} audio files")
+        return audio_by_slide
+    
+    def _share_slide_audio(self, audio_path: str, slide_num: int, output_dir: str) -> str:
+        """Give a slide whose narration matches another's that slide's audio file"""
+        output_path = os.path.join(output_dir, f"slide_{slide_num:03d}.wav")
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        link_or_copy(audio_path, output_path)
+        return output_path
     
-    def generate_audio_batch(self, slides_data: List[Dict], output_dir: str) -> List[str]:
-        """Generate audio for all slides"""
+    def generate_audio_batch(self, slides_data: List[Dict], output_dir: str,
+                             on_ready: Optional[Callable[[str], None]] = None) -> List[str]:
+        """Generate audio for all slides, calling on_ready with each audio path as soon as it exists"""
         self.logger.info("Generating audio for all slides...")
         
         # Ensure output directory exists
         os.makedirs(output_dir, exist_ok=True)
         
-        audio_files = []
         failed_slides = []
         total_slides = len(slides_data)
+        if not total_slides:
+            return []
         
-        for i, slide_data in enumerate(slides_data):
-            slide_num = slide_data['slide_number']
-            text = slide_data['narration_text']  # Use enhanced explanation
-            
-            # Update progress and status
-            progress = 25 + (i * 15) // total_slides  # 25-40% range
-            current_step = f"Generating audio for slide {slide_num}/{total_slides}"
-            print(f"\n🎵 PROCESSING SLIDE {slide_num}/{total_slides} - Generating audio...")
-            self.logger.info(f"Processing slide {slide_num}/{total_slides} (Progress: {progress}%)")
-            
-            # Update global status for frontend
-            self.update_status(progress, current_step)
-            
-            if not text.strip():
-                self.logger.warning(f"WARNING: No text found for slide {slide_num}, skipping")
-                failed_slides.append(slide_num)
-                continue
-            
-            output_path = os.path.join(output_dir, f"slide_{slide_num:03d}.wav")
-            
-            # Skip if file exists and skip_existing is enabled
-            if (os.path.exists(output_path) and 
-                self.config.config['processing']['skip_existing'] and
-                os.path.getsize(output_path) > 0):
-                self.logger.info(f"SKIP: Slide {slide_num}, audio already exists")
-                audio_files.append(output_path)
-                continue
-            
-            # Try to generate audio with retry logic
-            max_retries = 3
-            success = False
-            
-            for attempt in range(max_retries):
-                current_step = f"Generating audio for slide {slide_num}/{total_slides} (attempt {attempt + 1}/{max_retries})"
-                print(f"🔄 ATTEMPT {attempt + 1}/{max_retries} for slide {slide_num}")
-                self.logger.info(f"Generating audio for slide {slide_num} (attempt {attempt + 1}/{max_retries})")
-                self.update_status(progress, current_step)
-                
-                if self.generate_audio(text, output_path):
-                    audio_files.append(output_path)
-                    success = True
-                    print(f"✅ AUDIO GENERATED FOR SLIDE {slide_num}/{total_slides} - Moving to next slide")
-                    self.logger.info(f"SUCCESS: Audio generated for slide {slide_num}")
-                    # Update status to show completion
-                    current_step = f"Audio generated for slide {slide_num}/{total_slides} - Moving to next slide"
-                    self.update_status(progress, current_step)
-                    break
+        # A cloud batch job synthesizes what it can in one request; the local
+        # engine handles whatever is left, including everything if the job fails
+        audio_by_slide = self._generate_cloud_batch(slides_data, output_dir) if self.cloud_tts else {}
+        cloud_slides = set(audio_by_slide)
+        if on_ready:
+            for slide_num in sorted(audio_by_slide):
+                on_ready(audio_by_slide[slide_num])
+        pending_slides = [slide_data for slide_data in slides_data
+                          if slide_data['slide_number'] not in cloud_slides]
+        
+        # One directory scan finds the audio earlier runs left, instead of a stat per slide
+        if self.config.config['processing']['skip_existing']:
+            existing = set(list_nonempty_files(output_dir, ".wav"))
+            missing_slides = []
+            for slide_data in pending_slides:
+                output_path = os.path.join(output_dir, f"slide_{slide_data['slide_number']:03d}.wav")
+                if slide_data['narration_text'].strip() and output_path in existing:
+                    self.logger.info(f"SKIP: Slide {slide_data['slide_number']}, audio already exists")
+                    audio_by_slide[slide_data['slide_number']] = output_path
+                    if on_ready:
+                        on_ready(output_path)
                 else:
-                    print(f"❌ ATTEMPT {attempt + 1} FAILED for slide {slide_num}")
-                    self.logger.warning(f"Attempt {attempt + 1} failed for slide {slide_num}")
-                    if attempt < max_retries - 1:
-                        # Reset engine between retries
-                        print(f"🔄 Resetting TTS engine before retry {attempt + 2}")
-                        self.logger.info(f"Resetting TTS engine before retry {attempt + 2}")
-                        self.tts_manager.reset_engine()
-                        time.sleep(2)  # Wait before retry
-            
-            if not success:
-                print(f"❌ FAILED TO GENERATE AUDIO FOR SLIDE {slide_num} after {max_retries} attempts - SKIPPING")
-                self.logger.error(f"ERROR: Failed to generate audio for slide {slide_num} after {max_retries} attempts")
-                failed_slides.append(slide_num)
-            else:
-                # Reset engine after each successful generation to prevent sticking
-                self.logger.info(f"Resetting TTS engine after slide {slide_num}")
-                self.tts_manager.reset_engine()
-                # Small delay to ensure status update is sent
-                time.sleep(0.5)
+                    missing_slides.append(slide_data)
+            pending_slides = missing_slides
+        completed = total_slides - len(pending_slides)
+        
+        # Slides are independent, so fan them out over workers that each own a
+        # TTS engine; engines that are not reentrant limit this to one worker
+        max_workers = max(1, min(os.cpu_count() or 1, len(pending_slides), self.tts_manager.max_parallel))
+        
+        # Slides with identical narration (repeated headers, empty notes) are
+        # synthesized once; the others share the first slide's audio
+        first_slide_by_text = {}
+        repeats = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tts") as executor:
+            futures = {}
+            for i, slide_data in enumerate(pending_slides):
+                text = slide_data['narration_text']
+                if text.strip() and text in first_slide_by_text:
+                    repeats.setdefault(first_slide_by_text[text], []).append(slide_data['slide_number'])
+                    continue
+                first_slide_by_text[text] = slide_data['slide_number']
+                progress = 25 + (i * 15) // total_slides  # 25-40% range
+                future = executor.submit(self._generate_slide_audio, slide_data, output_dir, total_slides, progress)
+                futures[future] = slide_data['slide_number']
+            
+            for future in as_completed(futures):
+                slide_num = futures[future]
+                output_path = future.result()
+                for num in [slide_num, *repeats.get(slide_num, [])]:
+                    completed += 1
+                    if output_path:
+                        audio_path = output_path if num == slide_num else self._share_slide_audio(output_path, num, output_dir)
+                        audio_by_slide[num] = audio_path
+                        if on_ready:
+                            on_ready(audio_path)
+                    else:
+                        failed_slides.append(num)
+                
+                # Update global status for frontend
+                progress = 25 + (completed * 15) // total_slides  # 25-40% range
+                self.update_status(progress, f"Audio ready for {completed}/{total_slides} slides")
+        
+        if repeats:
+            self.logger.info(f"SKIP: {sum(map(len, repeats.values()))} slides repeat another slide's narration")
+        
+        audio_files = [audio_by_slide[slide_num] for slide_num in sorted(audio_by_slide)]
+        
+        # Known narration lengths let the composer cut every slide exactly
+        self.audio_durations = {}
+        for audio_path in audio_files:
+            duration = audio_duration(audio_path)
+            if duration:
+                self.audio_durations[os.path.splitext(os.path.basename(audio_path))[0]] = duration
+        
+        # Record which cache entry each slide used, for debugging stale audio
+        manifest = {
+            slide_data['slide_number']: self.cloud_tts.name if slide_data['slide_number'] in cloud_slides
+            else os.path.splitext(os.path.basename(self._narration_cache_path(slide_data['narration_text'])))[0]
+            for slide_data in slides_data
+            if slide_data['slide_number'] in audio_by_slide
+        }
+        with open(os.path.join(output_dir, 'manifest.json'), 'w') as f:
+            json.dump(manifest, f, indent=2)
         
         if failed_slides:
-            self.logger.warning(f"WARNING: Failed to generate audio for slides: {failed_slides}")
+            self.logger.warning(f"WARNING: Failed to generate audio for slides: {sorted(failed_slides)}")
         
         self.logger.info(f"SUCCESS: Generated {len(audio_files)} audio files out of {len(slides_data)} slides")
         return audio_files
 
+_SLIDE_NUM_RE = re.compile(r'slide_(\d+)')
+
+def slide_number(path: str) -> Optional[int]:
+    """Slide number in a pipeline file name such as slide_012.wav"""
+    match = _SLIDE_NUM_RE.search(os.path.basename(path))
+    return int(match.group(1)) if match else None
+
+# Runs Wav2Lip over many audio files in one process (see wav2lip_batch.py)
+WAV2LIP_BATCH_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "wav2lip_batch.py")
+
+@lru_cache(maxsize=1)
+def visible_gpus() -> Tuple[str, ...]:
+    """CUDA device ids child processes may use (empty if none are known)"""
+    visible = os.environ.get("CUDA_VISIBLE_DEVICES")
+    if visible is not None:
+        return tuple(device.strip() for device in visible.split(",") if device.strip())
+    try:
+        result = subprocess.run(["nvidia-smi", "-L"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return ()
+    return tuple(str(i) for i, line in enumerate(
+        line for line in result.stdout.splitlines() if line.startswith("GPU ")))
+
 class Wav2LipProcessor:
     """Wav2Lip processor"""
     
@@ -733,6 +1820,17 @@ class Wav2LipProcessor:
         self.wav2lip_path = os.path.join(config.config['wav2lip']['path'])
         self.checkpoint_path = os.path.join(self.wav2lip_path, config.config['wav2lip']['checkpoint'])
         self.system_instance = None  # Will be set by the main system
+        
+        # Warm wav2lip_batch.py --serve processes, one per thread and GPU
+        self._local = threading.local()
+        self._workers = []
+        self._workers_lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, Wav2LipProcessor._kill_workers, self._workers)
+        
+        # Slides started by prefetch() while narration is still being synthesized
+        self._prefetch_pool = None
+        self._prefetched = {}
+        self._prefetch_cancelled = threading.Event()
     
     def set_system_instance(self, system_instance):
         """Set reference to main system for status updates"""
@@ -743,12 +1841,122 @@ class Wav2LipProcessor:
         if self.system_instance:
             self.system_instance.processing_status['progress'] = progress
             self.system_instance.processing_status['current_step'] = current_step
-            # Show status update prominently in terminal
-            print(f"\n🔄 STATUS UPDATE: {progress}% - {current_step}")
-            self.logger.info(f"Status updated: {progress}% - {current_step}")
+            # Printing and logging happen on the system's status thread
+            self.system_instance.status_queue.put((progress, current_step))
     
-    def animate_face(self, audio_path: str, face_path: str, output_path: str) -> bool:
-        """Animate face using Wav2Lip"""
+    @staticmethod
+    def _kill_workers(workers: List[Dict]):
+        """Stop worker processes and remove their scratch directories"""
+        while workers:
+            worker = workers.pop()
+            process = worker['process']
+            try:
+                process.stdin.close()
+                process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
+                process.wait()
+            shutil.rmtree(worker['work_dir'], ignore_errors=True)
+    
+    def close(self):
+        """Stop every Wav2Lip worker process"""
+        with self._workers_lock:
+            Wav2LipProcessor._kill_workers(self._workers)
+    
+    def _discard_worker(self, worker: Dict):
+        """Stop one worker, e.g. after it crashed or hung"""
+        with self._workers_lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        Wav2LipProcessor._kill_workers([worker])
+        self._local.workers.pop(worker['gpu'], None)
+    
+    def _ensure_worker(self, face_path: str, gpu: Optional[str] = None) -> Optional[Dict]:
+        """Return this thread's warm Wav2Lip process for gpu, starting it if needed"""
+        if not self.can_batch():
+            return None
+        
+        workers = self._local.__dict__.setdefault('workers', {})
+        worker = workers.get(gpu)
+        if worker is not None:
+            if worker['process'].poll() is None:
+                return worker
+            self.logger.warning("WARNING: Wav2Lip worker exited, restarting it")
+            self._discard_worker(worker)
+        
+        work_dir = tempfile.mkdtemp(prefix="wav2lip_", dir=self.config.config['directories']['temp'])
+        os.makedirs(os.path.join(work_dir, "temp"), exist_ok=True)
+        manifest_path = self._write_manifest(work_dir, face_path, [])
+        
+        env = None
+        if gpu is not None:
+            env = {**os.environ, "CUDA_VISIBLE_DEVICES": gpu}
+        
+        self.logger.info("Starting Wav2Lip worker process...")
+        process = subprocess.Popen(
+            [sys.executable, WAV2LIP_BATCH_SCRIPT, "--serve", manifest_path],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, errors='replace', bufsize=1, cwd=work_dir, env=env
+        )
+        worker = {"process": process, "work_dir": work_dir, "gpu": gpu,
+                  "replies": queue.SimpleQueue(), "last_activity": time.monotonic()}
+        
+        def read_replies():
+            for line in process.stdout:
+                if line.strip():
+                    worker['replies'].put(json.loads(line))
+            worker['replies'].put(None)  # The worker exited
+        
+        def read_log():
+            for line in process.stderr:
+                worker['last_activity'] = time.monotonic()
+                line = line.rstrip()
+                if line:
+                    self.logger.info(line)
+        
+        threading.Thread(target=read_replies, daemon=True).start()
+        threading.Thread(target=read_log, daemon=True).start()
+        
+        with self._workers_lock:
+            self._workers.append(worker)
+        workers[gpu] = worker
+        return worker
+    
+    def _animate_with_worker(self, worker: Dict, audio_path: str, face_path: str, output_path: str) -> bool:
+        """Send one job to a warm Wav2Lip worker and wait for its reply"""
+        job = {"audio": os.path.abspath(audio_path), "face": self._stage_face(worker['work_dir'], face_path),
+               "outfile": os.path.abspath(output_path)}
+        worker['last_activity'] = time.monotonic()
+        try:
+            worker['process'].stdin.write(json.dumps(job) + "\n")
+            worker['process'].stdin.flush()
+        except OSError as e:
+            self.logger.error(f"ERROR: Wav2Lip worker is gone: {e}")
+            self._discard_worker(worker)
+            return False
+        
+        while True:
+            try:
+                reply = worker['replies'].get(timeout=0.5)
+                break
+            except queue.Empty:
+                if time.monotonic() - worker['last_activity'] > 300:  # 5 minutes without output
+                    self.logger.error(f"ERROR: Wav2Lip stopped responding for {audio_path}")
+                    self._discard_worker(worker)
+                    return False
+        
+        if reply is None:
+            self.logger.error(f"ERROR: Wav2Lip worker exited while animating {audio_path}")
+            self._discard_worker(worker)
+            return False
+        if not reply['ok']:
+            self.logger.error(f"ERROR: Wav2Lip error: {reply.get('error')}")
+            return False
+        return True
+    
+    def animate_face(self, audio_path: str, face_path: str, output_path: str,
+                     gpu: Optional[str] = None) -> bool:
+        """Animate face using Wav2Lip, optionally pinned to one GPU"""
         try:
             # Validate input files
             if not os.path.exists(audio_path):
@@ -759,6 +1967,11 @@ class Wav2LipProcessor:
                 self.logger.error(f"ERROR: Face image not found: {face_path}")
                 return False
             
+            # The old output may be a hardlink into the static video cache, so
+            # unlink it rather than letting ffmpeg overwrite it in place
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            
             # Check if Wav2Lip directory exists
             if not os.path.exists(self.wav2lip_path):
                 self.logger.warning(f"WARNING: Wav2Lip directory not found: {self.wav2lip_path}")
@@ -771,30 +1984,35 @@ class Wav2LipProcessor:
                 self.logger.warning("Creating a simple video with static face image instead...")
                 return self._create_static_video(audio_path, face_path, output_path)
             
+            self.logger.info(f"Animating face for {os.path.basename(audio_path)}...")
+            worker = self._ensure_worker(face_path, gpu)
+            if worker is not None:
+                if not self._animate_with_worker(worker, audio_path, face_path, output_path):
+                    return False
+                if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+                    self.logger.info(f"SUCCESS: Animation complete: {output_path}")
+                    return True
+                self.logger.error(f"ERROR: Animation output file not created or empty: {output_path}")
+                return False
+            
+            work_dir = tempfile.mkdtemp(prefix="wav2lip_", dir=self.config.config['directories']['temp'])
             command = [
-                "python", os.path.join(self.wav2lip_path, "inference.py"),
-                "--checkpoint_path", self.checkpoint_path,
-                "--face", face_path,
-                "--audio", audio_path,
-                "--outfile", output_path,
-                "--static", "True",
-                "--fps", str(self.config.config['video']['fps']),
-                "--pads", "0", "20", "0", "0",  # Add padding to include chin and mouth area
-                "--resize_factor", "1",  # Don't resize down
-                "--wav2lip_batch_size", "2"  # Even smaller batch size for stability
+                sys.executable, os.path.abspath(os.path.join(self.wav2lip_path, "inference.py")),
+                "--checkpoint_path", os.path.abspath(self.checkpoint_path),
+                "--face", self._stage_face(work_dir, face_path),
+                "--audio", os.path.abspath(audio_path),
+                "--outfile", os.path.abspath(output_path),
+                *self._inference_options()
             ]
             
-            self.logger.info(f"Animating face for {os.path.basename(audio_path)}...")
             self.logger.info(f"Command: {' '.join(command)}")
             
-            result = subprocess.run(
-                command, 
-                check=True, 
-                capture_output=True, 
-                text=True,
-                cwd=os.getcwd(),
-                timeout=300  # 5 minute timeout
-            )
+            returncode, output = self._run_wav2lip(command, gpu, work_dir=work_dir)
+            
+            if returncode != 0:
+                self.logger.error(f"ERROR: Wav2Lip error: {output}")
+                self.logger.error(f"Command that failed: {' '.join(command)}")
+                return False
             
             # Verify output file was created
             if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
@@ -805,58 +2023,237 @@ class Wav2LipProcessor:
                 return False
             
         except subprocess.TimeoutExpired:
-            self.logger.error(f"ERROR: Wav2Lip timeout for {audio_path}")
-            return False
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"ERROR: Wav2Lip error: {e.stderr}")
-            self.logger.error(f"Command that failed: {' '.join(command)}")
+            self.logger.error(f"ERROR: Wav2Lip stopped responding for {audio_path}")
             return False
         except Exception as e:
             self.logger.error(f"ERROR: Face animation: {e}")
             return False
     
+    def _inference_options(self) -> List[str]:
+        """inference.py options shared by single and batched runs"""
+        return [
+            "--static", "True",
+            "--fps", str(self.config.config['video']['fps']),
+            "--pads", "0", "20", "0", "0",  # Add padding to include chin and mouth area
+            "--resize_factor", "1",  # Don't resize down
+            "--wav2lip_batch_size", "2"  # Even smaller batch size for stability
+        ]
+    
+    def _run_wav2lip(self, command: List[str], gpu: Optional[str] = None,
+                     work_dir: Optional[str] = None) -> Tuple[int, str]:
+        """Run a Wav2Lip command in its own scratch directory
+        
+        inference.py writes temp/result.avi and temp/temp.wav relative to its
+        working directory, so concurrent runs each get a private one.
+        """
+        env = None
+        if gpu is not None:
+            env = {**os.environ, "CUDA_VISIBLE_DEVICES": gpu}
+        
+        if work_dir is None:
+            work_dir = tempfile.mkdtemp(prefix="wav2lip_", dir=self.config.config['directories']['temp'])
+        try:
+            os.makedirs(os.path.join(work_dir, "temp"), exist_ok=True)
+            return run_streamed(
+                command,
+                idle_timeout=300,  # Give up after 5 minutes without output
+                cwd=work_dir,
+                log_level=logging.INFO,
+                env=env
+            )
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    @staticmethod
+    def _stage_face(work_dir: str, face_path: str) -> str:
+        """Link the face into a scratch directory under a dot-free name, returning that name
+        
+        inference.py decides image vs video with face.split('.')[1], which breaks
+        on any dot earlier in the path. Naming the copy after its contents keeps
+        a warm worker's per-face detection cache apart for different faces.
+        """
+        face_name = f"face_{file_digest(face_path)}{os.path.splitext(face_path)[1].lower()}"
+        staged_path = os.path.join(work_dir, face_name)
+        if not os.path.exists(staged_path):
+            link_or_copy(face_path, staged_path)
+        return face_name
+    
+    def _write_manifest(self, work_dir: str, face_path: str, jobs: List[Tuple[str, str]]) -> str:
+        """Write the wav2lip_batch.py manifest for (audio, output) jobs, returning its path"""
+        encoder_args = video_encoder_args(self.config.config['video']['encoder'])
+        manifest = {
+            "wav2lip_path": os.path.abspath(self.wav2lip_path),
+            "checkpoint_path": os.path.abspath(self.checkpoint_path),
+            # Resolved against work_dir, which the batch process runs in
+            "face": self._stage_face(work_dir, face_path),
+            "args": self._inference_options(),
+            # Frames are piped into this encoder instead of a temporary avi
+            "encoder": encoder_args,
+            "frame_filter": encoder_frame_filter(encoder_args),
+            # Half precision on CUDA roughly doubles throughput with no visible change
+            "fp16": self.config.config['wav2lip']['fp16'],
+            "jobs": [{"audio": os.path.abspath(audio_path), "outfile": os.path.abspath(output_path)}
+                     for audio_path, output_path in jobs]
+        }
+        manifest_path = os.path.join(work_dir, "manifest.json")
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        return manifest_path
+    
+    def can_batch(self) -> bool:
+        """Check whether several slides can share one Wav2Lip process"""
+        return (os.path.exists(WAV2LIP_BATCH_SCRIPT) and
+                os.path.exists(self.wav2lip_path) and
+                os.path.exists(self.checkpoint_path))
+    
+    def animate_faces_all(self, jobs: List[Tuple[str, str]], face_path: str,
+                          gpu: Optional[str] = None) -> bool:
+        """Animate several (audio, output) pairs in one process so the model loads once"""
+        work_dir = tempfile.mkdtemp(prefix="wav2lip_", dir=self.config.config['directories']['temp'])
+        manifest_path = self._write_manifest(work_dir, face_path, jobs)
+        
+        self.logger.info(f"Animating {len(jobs)} slides in one Wav2Lip process...")
+        try:
+            returncode, output = self._run_wav2lip([sys.executable, WAV2LIP_BATCH_SCRIPT, manifest_path],
+                                                   gpu, work_dir=work_dir)
+        except subprocess.TimeoutExpired:
+            self.logger.error("ERROR: Batched Wav2Lip stopped responding")
+            return False
+        
+        if returncode != 0:
+            self.logger.warning(f"WARNING: Batched Wav2Lip reported failures: {output}")
+        return returncode == 0
+    
     def _create_static_video(self, audio_path: str, face_path: str, output_path: str) -> bool:
         """Create a simple video with static face image and audio"""
         try:
             self.logger.info(f"Creating static video for {os.path.basename(audio_path)}...")
             
-            # Get audio duration
-            cmd_duration = [
-                "ffprobe", "-v", "quiet", "-show_entries", "format=duration",
-                "-of", "csv=p=0", audio_path
-            ]
+            # The video depends only on the two inputs, so identical ones reuse an earlier result
+            cache_path = os.path.join(self.config.config['directories']['cache'], 'static',
+                                      f"{file_digest(audio_path)}_{file_digest(face_path)}.mp4")
+            if os.path.exists(cache_path) and os.path.getsize(cache_path) > 0:
+                link_or_copy(cache_path, output_path)
+                self.logger.info(f"SUCCESS: Reused cached static video: {output_path}")
+                return True
             
-            result = subprocess.run(cmd_duration, capture_output=True, text=True)
-            duration = float(result.stdout.strip()) if result.returncode == 0 else 5.0
+            # Get audio duration from the file header, falling back to ffprobe
+            duration = audio_duration(audio_path) or 5.0
             
             # Create video with static face image and audio
             # Use scale filter to ensure even dimensions for H.264 compatibility
-            cmd = [
-                "ffmpeg", "-y",
-                "-loop", "1", "-i", face_path,  # Static face image
-                "-i", audio_path,  # Audio file
-                "-vf", "scale=426:640",  # Ensure even dimensions (427->426, 640 is already even)
-                "-c:v", "libx264",
-                "-c:a", "aac",
-                "-t", str(duration),
-                "-pix_fmt", "yuv420p",
-                "-shortest",
-                output_path
-            ]
+            def static_video_cmd(encoder_args):
+                return [
+                    *FFMPEG,
+                    "-loop", "1", "-i", face_path,  # Static face image
+                    "-i", audio_path,  # Audio file
+                    # Ensure even dimensions (427->426, 640 is already even)
+                    "-vf", f"scale=426:640,{encoder_frame_filter(encoder_args)}",
+                    *encoder_args,
+                    "-c:a", "aac",
+                    "-t", str(duration),
+                    "-shortest",
+                    output_path
+                ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            encoder_args = video_encoder_args(self.config.config['video']['encoder'])
+            returncode, output = run_streamed(static_video_cmd(encoder_args), idle_timeout=120)
+            if returncode != 0 and encoder_args != SOFTWARE_ENCODER:
+                self.logger.warning(f"WARNING: Hardware encoding failed, retrying with libx264: {output}")
+                returncode, output = run_streamed(static_video_cmd(SOFTWARE_ENCODER), idle_timeout=120)
             
-            if result.returncode == 0 and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+            if returncode == 0 and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+                link_or_copy(output_path, cache_path)
                 self.logger.info(f"SUCCESS: Created static video: {output_path}")
                 return True
             else:
-                self.logger.error(f"ERROR: Failed to create static video: {result.stderr}")
+                self.logger.error(f"ERROR: Failed to create static video: {output}")
                 return False
                 
         except Exception as e:
             self.logger.error(f"ERROR: Static video creation: {e}")
             return False
     
+    def _animate_slide(self, i: int, audio_path: str, face_path: str, output_dir: str,
+                       total_videos: int, gpu: Optional[str], skip_existing: bool,
+                       report_status: bool = True, cancelled: Optional[threading.Event] = None) -> Optional[str]:
+        """Animate the face for one audio file with retries, returning the video path or None"""
+        log = self.logger
+        base_name = os.path.splitext(os.path.basename(audio_path))[0]
+        output_path = os.path.join(output_dir, f"{base_name}_animated.mp4")
+        
+        # Extract slide number from filename
+        slide_num = slide_number(audio_path) or i + 1
+        
+        # Update progress and status
+        progress = 50 + (i * 25) // total_videos  # 50-75% range
+        print(f"\n🎭 PROCESSING SLIDE {slide_num}/{total_videos} - Animating face...")
+        log.info(f"Animating face for slide {slide_num}/{total_videos} (Progress: {progress}%)")
+        
+        if skip_existing and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+            log.info(f"SKIP: {base_name}, video already exists")
+            return output_path
+        
+        # Try to animate face with retry logic
+        max_retries = 2
+        
+        for attempt in range(max_retries):
+            if cancelled is not None and cancelled.is_set():
+                log.info(f"SKIP: {base_name}, its run was abandoned")
+                return None
+            current_step = f"Animating face for slide {slide_num}/{total_videos} (attempt {attempt + 1}/{max_retries})"
+            log.info(f"Animating face for {base_name} (attempt {attempt + 1}/{max_retries})")
+            if report_status:
+                self.update_status(progress, current_step)
+            
+            if self.animate_face(audio_path, face_path, output_path, gpu=gpu):
+                print(f"✅ FACE ANIMATED FOR SLIDE {slide_num}/{total_videos}")
+                log.info(f"SUCCESS: Face animated for slide {slide_num}")
+                return output_path
+            
+            log.warning(f"Attempt {attempt + 1} failed for {base_name}")
+            if attempt < max_retries - 1:
+                time.sleep(min(2 ** attempt, 5))  # Short backoff before retrying
+        
+        log.error(f"ERROR: Failed to animate face for {base_name} after {max_retries} attempts")
+        return None
+    
+    def prefetch(self, i: int, audio_path: str, face_path: str, output_dir: str, total_videos: int):
+        """Start animating one slide as soon as its audio exists, ahead of animate_faces_batch
+        
+        Lip sync of the first slides then overlaps synthesis of the later ones;
+        animate_faces_batch collects these results instead of redoing them.
+        """
+        processing = self.config.config['processing']
+        if self._prefetch_pool is None:
+            self._prefetch_cancelled = threading.Event()
+            self._prefetch_pool = ThreadPoolExecutor(max_workers=processing['parallel_workers'],
+                                                     thread_name_prefix="wav2lip")
+        gpus = visible_gpus()
+        self._prefetched[os.path.abspath(audio_path)] = self._prefetch_pool.submit(
+            self._animate_slide, i, audio_path, face_path, output_dir, total_videos,
+            gpus[i % len(gpus)] if len(gpus) > 1 else None, processing['skip_existing'], False,
+            self._prefetch_cancelled)
+    
+    def cancel_prefetch(self):
+        """Abandon slides prefetch() started for a run that failed before animate_faces_batch
+        
+        Their futures are keyed by audio path, which the next run reuses, so
+        they must not survive into it; the workers are stopped as well so
+        Wav2Lip does not keep the GPU busy for a job that already failed.
+        """
+        if self._prefetch_pool is None:
+            return
+        self._prefetch_cancelled.set()
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched.clear()
+        # Killing the workers ends the jobs in flight; the cancelled flag stops their retries
+        self.close()
+        self._prefetch_pool.shutdown()
+        self._prefetch_pool = None
+        self.close()  # Anything started between the first close and the retry check
+    
     def animate_faces_batch(self, audio_files: List[str], face_path: str, output_dir: str) -> List[str]:
         """Animate faces for all audio files"""
         self.logger.info("Starting batch face animation...")
@@ -864,62 +2261,92 @@ class Wav2LipProcessor:
         # Ensure output directory exists
         os.makedirs(output_dir, exist_ok=True)
         
-        animated_videos = []
-        failed_animations = []
         total_videos = len(audio_files)
+        if not total_videos:
+            return []
         
-        for i, audio_path in enumerate(audio_files):
-            base_name = os.path.splitext(os.path.basename(audio_path))[0]
-            output_path = os.path.join(output_dir, f"{base_name}_animated.mp4")
-            
-            # Extract slide number from filename
-            slide_num = base_name.replace('slide_', '').lstrip('0') or '1'
-            
-            # Update progress and status
-            progress = 50 + (i * 25) // total_videos  # 50-75% range
-            current_step = f"Animating face for slide {slide_num}/{total_videos}"
-            print(f"\n🎭 PROCESSING SLIDE {slide_num}/{total_videos} - Animating face...")
-            self.logger.info(f"Animating face for slide {slide_num}/{total_videos} (Progress: {progress}%)")
-            
-            # Update global status for frontend
-            self.update_status(progress, current_step)
-            
-            if (os.path.exists(output_path) and 
-                self.config.config['processing']['skip_existing'] and
-                os.path.getsize(output_path) > 0):
-                self.logger.info(f"SKIP: {base_name}, video already exists")
-                animated_videos.append(output_path)
-                continue
-            
-            # Try to animate face with retry logic
-            max_retries = 2
-            success = False
-            
-            for attempt in range(max_retries):
-                current_step = f"Animating face for slide {slide_num}/{total_videos} (attempt {attempt + 1}/{max_retries})"
-                self.logger.info(f"Animating face for {base_name} (attempt {attempt + 1}/{max_retries})")
-                self.update_status(progress, current_step)
+        # Each slide is an independent Wav2Lip process; run several at once and
+        # spread them over the visible GPUs
+        gpus = visible_gpus()
+        processing = self.config.config['processing']
+        max_workers = min(total_videos, processing['parallel_workers'])
+        skip_existing = processing['skip_existing']
+        results = [None] * total_videos
+        output_paths = [
+            os.path.join(output_dir, f"{os.path.splitext(os.path.basename(audio_path))[0]}_animated.mp4")
+            for audio_path in audio_files
+        ]
+        
+        # Slides started during narration already went through the per-slide path with retries
+        prefetched = {i: self._prefetched.pop(os.path.abspath(audio_path))
+                      for i, audio_path in enumerate(audio_files)
+                      if os.path.abspath(audio_path) in self._prefetched}
+        if prefetched:
+            self.update_status(50, f"Finishing {len(prefetched)} faces started during narration...")
+            for i, future in prefetched.items():
+                results[i] = future.result()
+        if self._prefetch_pool is not None:
+            for future in self._prefetched.values():
+                future.cancel()
+            self._prefetched.clear()
+            self._prefetch_pool.shutdown()
+            self._prefetch_pool = None
+        
+        # Batch the slides that need work into one Wav2Lip process per worker, so
+        # the model and face detection load once per worker instead of per slide
+        # One directory scan finds the videos earlier runs left, instead of a stat per slide
+        existing = set(list_nonempty_files(output_dir, "_animated.mp4")) if skip_existing else set()
+        for i, output_path in enumerate(output_paths):
+            if i not in prefetched and output_path in existing:
+                results[i] = output_path
+        pending = [i for i in range(total_videos) if results[i] is None and i not in prefetched]
+        if len(pending) > 1 and self.can_batch():
+            self.update_status(50, f"Animating faces for {len(pending)} slides...")
+            for i in pending:
+                # Stale output must not be mistaken for a result of this batch
+                if os.path.exists(output_paths[i]):
+                    os.remove(output_paths[i])
+            
+            chunks = [pending[worker::max_workers] for worker in range(max_workers)]
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="wav2lip") as executor:
+                futures = [
+                    executor.submit(self.animate_faces_all,
+                                    [(audio_files[i], output_paths[i]) for i in chunk], face_path,
+                                    gpus[worker % len(gpus)] if len(gpus) > 1 else None)
+                    for worker, chunk in enumerate(chunks) if chunk
+                ]
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self.logger.warning(f"WARNING: Batched Wav2Lip failed: {e}")
+            
+            for i in pending:
+                if os.path.exists(output_paths[i]) and os.path.getsize(output_paths[i]) > 0:
+                    results[i] = output_paths[i]
+        
+        # Anything the batch did not produce goes through the per-slide path with retries
+        remaining = [i for i in range(total_videos) if results[i] is None and i not in prefetched]
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="wav2lip") as executor:
+            futures = {
+                executor.submit(self._animate_slide, i, audio_files[i], face_path, output_dir, total_videos,
+                                gpus[i % len(gpus)] if len(gpus) > 1 else None, skip_existing): i
+                for i in remaining
+            }
+            for completed, future in enumerate(as_completed(futures), total_videos - len(remaining) + 1):
+                results[futures[future]] = future.result()
                 
-                if self.animate_face(audio_path, face_path, output_path):
-                    animated_videos.append(output_path)
-                    success = True
-                    print(f"✅ FACE ANIMATED FOR SLIDE {slide_num}/{total_videos} - Moving to next slide")
-                    self.logger.info(f"SUCCESS: Face animated for slide {slide_num}")
-                    # Update status to show completion
-                    current_step = f"Face animated for slide {slide_num}/{total_videos} - Moving to next slide"
-                    self.update_status(progress, current_step)
-                    break
-                else:
-                    self.logger.warning(f"Attempt {attempt + 1} failed for {base_name}")
-                    if attempt < max_retries - 1:
-                        time.sleep(5)  # Wait before retry
-            
-            if not success:
-                self.logger.error(f"ERROR: Failed to animate face for {base_name} after {max_retries} attempts")
-                failed_animations.append(base_name)
-            else:
-                # Small delay to ensure status update is sent
-                time.sleep(0.5)
+                # Update global status for frontend
+                progress = 50 + (completed * 25) // total_videos  # 50-75% range
+                self.update_status(progress, f"Faces animated for {completed}/{total_videos} slides")
+        
+        # The pool's threads are gone, so their workers would only hold GPU memory
+        self.close()
+        
+        animated_videos = [output_path for output_path in results if output_path]
+        failed_animations = [os.path.splitext(os.path.basename(audio_path))[0]
+                             for audio_path, output_path in zip(audio_files, results) if not output_path]
         
         if failed_animations:
             self.logger.warning(f"WARNING: Failed to animate faces for: {failed_animations}")
@@ -927,6 +2354,273 @@ class Wav2LipProcessor:
         self.logger.info(f"SUCCESS: Generated {len(animated_videos)} animated videos out of {len(audio_files)} audio files")
         return animated_videos
 
+# Hardware H.264 encoders in order of preference, with their encoder arguments
+HARDWARE_ENCODERS = {
+    "h264_nvenc": ["-c:v", "h264_nvenc", "-preset", "p4", "-tune", "hq", "-b:v", "5M"],
+    "h264_videotoolbox": ["-c:v", "h264_videotoolbox", "-b:v", "5M"],
+    "h264_vaapi": ["-vaapi_device", "/dev/dri/renderD128", "-c:v", "h264_vaapi", "-b:v", "5M"],
+    "h264_qsv": ["-c:v", "h264_qsv", "-b:v", "5M"],
+}
+# veryfast encodes several times quicker than the default medium preset; slides
+# and a talking head are easy content, so the size cost at the same CRF is small
+SOFTWARE_ENCODER = ["-c:v", "libx264", "-preset", "veryfast", "-threads", "0", "-x264-params", "threads=auto"]
+
+# Filters that put frames in the form each encoder takes; VAAPI (Intel/AMD on
+# Linux) encodes GPU surfaces, so its frames are uploaded first
+ENCODER_FRAME_FILTERS = {
+    "h264_vaapi": "format=nv12,hwupload",
+    "h264_qsv": "format=nv12",
+}
+
+def encoder_frame_filter(encoder_args: List[str]) -> str:
+    """Last filter to apply before the given encoder"""
+    codec = encoder_args[encoder_args.index("-c:v") + 1]
+    return ENCODER_FRAME_FILTERS.get(codec, "format=yuv420p")
+
+def filter_thread_args() -> List[str]:
+    """Global ffmpeg options that let filter graphs use every core"""
+    threads = str(os.cpu_count() or 1)
+    return ["-filter_threads", threads, "-filter_complex_threads", threads]
+
+@lru_cache(maxsize=1)
+def detect_h264_encoder() -> List[str]:
+    """Find the fastest working H.264 encoder, falling back to libx264"""
+    try:
+        result = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"],
+                                capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return SOFTWARE_ENCODER
+    
+    candidates = [name for name in HARDWARE_ENCODERS if name in result.stdout]
+    if sys.platform == "darwin":
+        candidates.sort(key=lambda name: name != "h264_videotoolbox")
+    
+    for name in candidates:
+        # A listed encoder may still lack a device/driver, so try a tiny encode
+        test_cmd = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error",
+            "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+            "-vf", encoder_frame_filter(HARDWARE_ENCODERS[name]),
+            *HARDWARE_ENCODERS[name], "-f", "null", "-"
+        ]
+        try:
+            result = subprocess.run(test_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+            if result.returncode == 0:
+                logger.info(f"SUCCESS: Using hardware encoder {name}")
+                return HARDWARE_ENCODERS[name]
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+    
+    logger.info("No hardware H.264 encoder available, using libx264")
+    return SOFTWARE_ENCODER
+
+# Keep avatar decode, scale, overlay and NVENC encode on the GPU; the raw slide
+# frame is uploaded once per frame since it has no hardware decode path
+CUDA_DEVICE_ARGS = ["-init_hw_device", "cuda=cu", "-filter_hw_device", "cu"]
+CUDA_DECODE_ARGS = ["-hwaccel", "cuda", "-hwaccel_device", "cu", "-hwaccel_output_format", "cuda"]
+
+@lru_cache(maxsize=1)
+def cuda_filters_available() -> bool:
+    """Check that ffmpeg can upload, scale, overlay and encode on an NVIDIA GPU"""
+    test_cmd = [
+        "ffmpeg", "-hide_banner", "-loglevel", "error", *CUDA_DEVICE_ARGS,
+        "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+        "-f", "lavfi", "-i", "color=c=white:s=64x64:d=0.1",
+        "-filter_complex",
+        "[0:v]format=nv12,hwupload[bg];[1:v]format=nv12,hwupload,scale_cuda=32:32[av];"
+        "[bg][av]overlay_cuda=8:8[out]",
+        "-map", "[out]", *HARDWARE_ENCODERS["h264_nvenc"], "-f", "null", "-"
+    ]
+    try:
+        result = subprocess.run(test_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    if result.returncode == 0:
+        logger.info("SUCCESS: Using CUDA filters for slide composition")
+    return result.returncode == 0
+
+def video_encoder_args(preferred: str = "auto") -> List[str]:
+    """Get ffmpeg video encoder arguments for the configured encoder"""
+    if preferred == "auto":
+        return detect_h264_encoder()
+    return HARDWARE_ENCODERS.get(preferred, SOFTWARE_ENCODER)
+
+@lru_cache(maxsize=512)
+def _ffprobe_cached(path: str, mtime: float, entries: str, stream: Optional[str]) -> Optional[str]:
+    """Read a single ffprobe entry from a media file"""
+    cmd = ["ffprobe", "-v", "quiet"]
+    if stream:
+        cmd += ["-select_streams", stream]
+    cmd += ["-show_entries", entries, "-of", "csv=p=0", path]
+    try:
+        result = subprocess.run(spawn_args(cmd), capture_output=True, text=True, timeout=30, close_fds=False)
+    except subprocess.TimeoutExpired:
+        return None
+    value = result.stdout.strip()
+    return value if result.returncode == 0 and value else None
+
+def probe_duration(path: str) -> Optional[float]:
+    """Get a media file's duration in seconds, cached until the file changes"""
+    value = _ffprobe_cached(path, os.path.getmtime(path), "format=duration", None)
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+def probe_frame_rate(path: str) -> Optional[str]:
+    """Get a video's frame rate as an ffmpeg rate string (e.g. '25/1'), cached until the file changes"""
+    return _ffprobe_cached(path, os.path.getmtime(path), "stream=r_frame_rate", "v:0")
+
+def probe_audio_codec(path: str) -> Optional[str]:
+    """Get the codec name of a file's first audio stream, cached until the file changes"""
+    return _ffprobe_cached(path, os.path.getmtime(path), "stream=codec_name", "a:0")
+
+# Audio codecs an .mp4 can carry as they are
+MP4_AUDIO_CODECS = {"aac", "mp3", "opus"}
+
+def probe_frame_size(path: str) -> Optional[Tuple[int, int]]:
+    """Get a video's (width, height), cached until the file changes"""
+    value = _ffprobe_cached(path, os.path.getmtime(path), "stream=width,height", "v:0")
+    try:
+        width, height = value.split(",")[:2]
+        return int(width), int(height)
+    except (AttributeError, ValueError):
+        return None
+
+SLIDE_FRAME_SIZE = (1920, 1080)
+
+def prepare_slide_frame(slide_path: str, cache_dir: str, size: tuple = SLIDE_FRAME_SIZE) -> str:
+    """Decode and scale a slide image once into a raw BGR frame, reusing the cached frame on later runs
+    
+    Looping a PNG makes ffmpeg decode it again for every output frame; a raw
+    frame is just read back, so the background costs no decoding at all.
+    """
+    stat = os.stat(slide_path)
+    key = hashlib.sha1(f"{os.path.abspath(slide_path)}|{stat.st_mtime_ns}|{stat.st_size}|{size}".encode()).hexdigest()[:16]
+    frame_path = os.path.join(cache_dir, f"bg_{key}.rgb")
+    if not os.path.exists(frame_path):
+        # imdecode instead of imread so non-ASCII paths work on Windows
+        frame = cv2.imdecode(np.fromfile(slide_path, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if frame is None:
+            raise ValueError(f"Could not decode slide image: {slide_path}")
+        if (frame.shape[1], frame.shape[0]) != size:
+            frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        tmp_path = frame_path + ".tmp"
+        frame.tofile(tmp_path)
+        os.replace(tmp_path, frame_path)
+    return frame_path
+
+def prune_slide_frames(cache_dir: str, keep: List[str]):
+    """Delete raw slide frames (about 6 MB each) that the current slides no longer use"""
+    keep = {os.path.abspath(path) for path in keep}
+    with os.scandir(cache_dir) as entries:
+        stale = [entry.path for entry in entries
+                 if entry.name.startswith("bg_") and entry.name.endswith(".rgb")
+                 and os.path.abspath(entry.path) not in keep]
+    for path in stale:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def slide_frame_input_args(frame_path: str, frame_rate: str, size: tuple = SLIDE_FRAME_SIZE) -> List[str]:
+    """ffmpeg input arguments that loop a raw slide frame at the given frame rate"""
+    return [
+        "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{size[0]}x{size[1]}",
+        "-framerate", frame_rate, "-stream_loop", "-1", "-i", frame_path
+    ]
+
+AVATAR_SIZE = (320, 320)
+
+# overlay x:y for each avatar_position setting, worked out once for the slide frame
+_AVATAR_X = {"left": 0, "right": SLIDE_FRAME_SIZE[0] - AVATAR_SIZE[0]}
+_AVATAR_Y = {"top": 0, "bottom": SLIDE_FRAME_SIZE[1] - AVATAR_SIZE[1]}
+AVATAR_OVERLAY_POSITIONS = {f"{vertical}_{horizontal}": f"{x}:{y}"
+                            for vertical, y in _AVATAR_Y.items() for horizontal, x in _AVATAR_X.items()}
+
+def avatar_overlay_position(position: str) -> str:
+    """overlay filter x:y for an avatar_position setting, bottom right if it is unknown"""
+    return AVATAR_OVERLAY_POSITIONS.get(position, AVATAR_OVERLAY_POSITIONS["bottom_right"])
+
+def avatar_scale_filter(video_path: str, scale: str = "scale") -> str:
+    """Filter that sizes an avatar video for the overlay, a no-op when it already fits"""
+    if probe_frame_size(video_path) == AVATAR_SIZE:
+        return "null"
+    if scale == "scale":
+        # A downscaled talking head shows no difference from the default bicubic
+        return f"scale={AVATAR_SIZE[0]}:{AVATAR_SIZE[1]}:flags=fast_bilinear"
+    return f"{scale}={AVATAR_SIZE[0]}:{AVATAR_SIZE[1]}"
+
+def _compose_one(i: int, video_path: str, slide_path: str, temp_dir: str,
+                 encoder_args: List[str], duration: Optional[float] = None,
+                 overlay_xy: str = AVATAR_OVERLAY_POSITIONS["bottom_right"]) -> Optional[str]:
+    """Overlay one animated avatar on its slide image, returning the composite path or None"""
+    slide_num = i + 1
+    if not os.path.exists(video_path) or not os.path.exists(slide_path):
+        logger.warning(f"WARNING: Missing files for slide {slide_num}, skipping")
+        return None
+    
+    # Create a composite video with slide background and avatar
+    output_path = os.path.join(temp_dir, f"slide_{slide_num:03d}_composite.mp4")
+    
+    # Loop the slide at the avatar's frame rate so the two streams line up
+    # frame for frame, and stop at the avatar's length instead of -shortest
+    frame_rate = probe_frame_rate(video_path) or "25"
+    duration = duration or probe_duration(video_path)
+    length_args = ["-t", f"{min(duration, 30):.3f}"] if duration else ["-shortest", "-t", "30"]  # Limit to 30 seconds max per slide
+    
+    # The avatar's audio passes through unchanged, so only re-encode it if the container needs that
+    audio_args = ["-c:a", "copy"] if probe_audio_codec(video_path) in MP4_AUDIO_CODECS else ["-c:a", "aac"]
+    
+    # Use ffmpeg to overlay the animated avatar on the slide image
+    # Position avatar in its configured corner with proper size for lip-sync visibility
+    def composite_cmd(use_cuda: bool) -> List[str]:
+        if use_cuda:
+            device_args, decode_args = CUDA_DEVICE_ARGS, CUDA_DECODE_ARGS
+            overlay_filter = (f"[0:v]format=nv12,hwupload[bg];[1:v]{avatar_scale_filter(video_path, 'scale_cuda')}[avatar];"
+                              f"[bg][avatar]overlay_cuda={overlay_xy}[out]")
+        else:
+            device_args, decode_args = [], []
+            overlay_filter = (f"[1:v]{avatar_scale_filter(video_path)}[avatar];"
+                              f"[0:v][avatar]overlay={overlay_xy},{encoder_frame_filter(encoder_args)}[out]")
+        return [
+            *FFMPEG,
+            *filter_thread_args(),
+            *device_args,
+            *slide_frame_input_args(slide_path, frame_rate),  # Slide frame as background
+            *decode_args, "-i", video_path,  # Animated avatar video
+            "-filter_complex", overlay_filter,  # Smaller avatar in a corner
+            "-map", "[out]",
+            "-map", "1:a",  # Use audio from avatar video
+            *encoder_args,
+            *audio_args,
+            *length_args,
+            output_path
+        ]
+    
+    use_cuda = encoder_args == HARDWARE_ENCODERS["h264_nvenc"] and cuda_filters_available()
+    cmd = composite_cmd(use_cuda)
+    logger.info(f"  Creating composite video for slide {slide_num}...")
+    logger.info(f"  Command: {' '.join(cmd)}")
+    
+    try:
+        returncode, output = run_streamed(cmd, idle_timeout=120)
+        if returncode != 0 and use_cuda:
+            logger.warning(f"  WARNING: CUDA composition failed for slide {slide_num}, retrying on CPU: {output}")
+            returncode, output = run_streamed(composite_cmd(False), idle_timeout=120)
+    except subprocess.TimeoutExpired:
+        logger.error(f"  ERROR: Composite video for slide {slide_num} stopped responding")
+        return None
+    
+    if returncode == 0 and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+        logger.info(f"  SUCCESS: Created composite video for slide {slide_num}")
+        return output_path
+    
+    logger.error(f"  ERROR: Failed to create composite video for slide {slide_num}")
+    logger.error(f"  Return code: {returncode}")
+    logger.error(f"  Output: {output}")
+    return None
+
 class VideoComposer:
     """Video composer using ffmpeg"""
     
@@ -944,12 +2638,15 @@ class VideoComposer:
         if self.system_instance:
             self.system_instance.processing_status['progress'] = progress
             self.system_instance.processing_status['current_step'] = current_step
-            # Show status update prominently in terminal
-            print(f"\n🔄 STATUS UPDATE: {progress}% - {current_step}")
-            self.logger.info(f"Status updated: {progress}% - {current_step}")
+            # Printing and logging happen on the system's status thread
+            self.system_instance.status_queue.put((progress, current_step))
     
-    def compose_final_video_with_slides(self) -> bool:
-        """Compose final video with slide backgrounds and animated avatars"""
+    def compose_final_video_with_slides(self, durations: Optional[Dict[str, float]] = None) -> bool:
+        """Compose final video with slide backgrounds and animated avatars
+        
+        durations maps slide file names (e.g. 'slide_001') to their narration
+        length, so those slides need no probing and get an exact cut.
+        """
         self.logger.info("Creating final video with slide backgrounds...")
         
         # Check if we have the required files
@@ -962,23 +2659,9 @@ class VideoComposer:
         os.makedirs(slide_dir, exist_ok=True)
         os.makedirs(output_dir, exist_ok=True)
         
-        # Find animated videos
-        animated_videos = []
-        if os.path.exists(video_dir):
-            for file in os.listdir(video_dir):
-                if file.endswith("_animated.mp4"):
-                    file_path = os.path.join(video_dir, file)
-                    if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
-                        animated_videos.append(file_path)
-        
-        # Find slide images
-        slide_images = []
-        if os.path.exists(slide_dir):
-            for file in os.listdir(slide_dir):
-                if file.endswith(".png"):
-                    file_path = os.path.join(slide_dir, file)
-                    if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
-                        slide_images.append(file_path)
+        # Find animated videos and slide images, sorted so they match up
+        animated_videos = list_nonempty_files(video_dir, "_animated.mp4")
+        slide_images = list_nonempty_files(slide_dir, ".png")
         
         self.logger.info(f"Found {len(animated_videos)} animated videos")
         self.logger.info(f"Found {len(slide_images)} slide images")
@@ -991,10 +2674,6 @@ class VideoComposer:
             self.logger.error("ERROR: No slide images found")
             return False
         
-        # Sort files to match them properly
-        animated_videos.sort()
-        slide_images.sort()
-        
         # Verify we have matching pairs
         if len(animated_videos) != len(slide_images):
             self.logger.warning(f"WARNING: Mismatch - {len(animated_videos)} videos vs {len(slide_images)} slides")
@@ -1003,80 +2682,87 @@ class VideoComposer:
             animated_videos = animated_videos[:min_count]
             slide_images = slide_images[:min_count]
         
+        durations = durations or {}
+        slide_durations = [durations.get(os.path.basename(path)[:-len("_animated.mp4")])
+                           for path in animated_videos]
+        
         try:
             # Create temporary directory
             temp_dir = "temp"
             os.makedirs(temp_dir, exist_ok=True)
             
-            # Process each slide
-            processed_videos = []
+            # Slides are static, so decode and scale them once up front instead
+            # of having ffmpeg decode and scale the PNG on every frame
+            slide_images = [prepare_slide_frame(path, temp_dir) for path in slide_images]
+            # Re-rendered slides get new frames; drop the ones earlier runs left behind
+            prune_slide_frames(temp_dir, slide_images)
+            
+            final_output = os.path.join(output_dir, "final_presentation_with_slides.mp4")
+            
+            # Overlay and concatenate every slide in a single ffmpeg pass with one
+            # encoder; a failing hardware encoder gets a libx264 retry of the same
+            # pass before falling back to per-slide composites + concat below
+            self.update_status(75, "Composing final video...")
+            encoder_args = video_encoder_args(self.config.config['video']['encoder'])
+            overlay_xy = avatar_overlay_position(self.config.config['video']['avatar_position'])
+            if self._compose_fused(animated_videos, slide_images, slide_durations, final_output,
+                                   encoder_args, overlay_xy):
+                return True
+            if encoder_args != SOFTWARE_ENCODER:
+                self.logger.warning("WARNING: Single-pass composition failed, retrying with libx264")
+                if self._compose_fused(animated_videos, slide_images, slide_durations, final_output,
+                                       SOFTWARE_ENCODER, overlay_xy):
+                    return True
+            self.logger.warning("WARNING: Single-pass composition failed, composing slides individually")
+            
+            # Each composite is an independent ffmpeg job, so run them side by side
+            # and collect the results in slide order for the concat list
             total_slides = len(animated_videos)
+            max_workers = min(total_slides, os.cpu_count() or 1)
+            self.update_status(75, f"Composing video for {total_slides} slides...")
             
-            for i, (video_path, slide_path) in enumerate(zip(animated_videos, slide_images)):
-                slide_num = i + 1
-                progress = 75 + (i * 20) // total_slides  # 75-95% range
-                current_step = f"Composing video for slide {slide_num}/{total_slides}"
-                self.logger.info(f"Processing slide {slide_num}/{total_slides} (Progress: {progress}%)")
-                
-                # Update global status for frontend
-                self.update_status(progress, current_step)
-                
-                if not os.path.exists(video_path) or not os.path.exists(slide_path):
-                    self.logger.warning(f"WARNING: Missing files for slide {slide_num}, skipping")
-                    continue
-                
-                # Create a composite video with slide background and avatar
-                output_path = os.path.join(temp_dir, f"slide_{i+1:03d}_composite.mp4")
-                
-                # Use ffmpeg to overlay the animated avatar on the slide image
-                # Position avatar in bottom right corner with proper size for lip-sync visibility
-                cmd = [
-                    "ffmpeg", "-y",
-                    "-loop", "1", "-i", slide_path,  # Slide image as background
-                    "-i", video_path,  # Animated avatar video
-                    "-filter_complex", 
-                    f"[0:v]scale=1920:1080[bg];[1:v]scale=320:320[avatar];[bg][avatar]overlay=1600:760[out]",  # Smaller avatar, bottom right corner
-                    "-map", "[out]",
-                    "-map", "1:a",  # Use audio from avatar video
-                    "-c:v", "libx264",
-                    "-c:a", "aac",
-                    "-shortest",
-                    "-t", "30",  # Limit to 30 seconds max per slide
-                    output_path
+            processed_videos = []
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_compose_one, i, video_path, slide_path, temp_dir, encoder_args, duration,
+                                    overlay_xy)
+                    for i, (video_path, slide_path, duration)
+                    in enumerate(zip(animated_videos, slide_images, slide_durations))
                 ]
-                
-                self.logger.info(f"  Creating composite video for slide {i+1}...")
-                self.logger.info(f"  Command: {' '.join(cmd)}")
-                
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-                
-                if result.returncode == 0 and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                    processed_videos.append(output_path)
-                    self.logger.info(f"  SUCCESS: Created composite video for slide {i+1}")
-                else:
-                    self.logger.error(f"  ERROR: Failed to create composite video for slide {i+1}")
-                    self.logger.error(f"  Return code: {result.returncode}")
-                    self.logger.error(f"  Error: {result.stderr}")
-                    self.logger.error(f"  Output: {result.stdout}")
+                for i, future in enumerate(futures):
+                    output_path = future.result()
+                    if output_path:
+                        processed_videos.append(output_path)
+                    progress = 75 + ((i + 1) * 20) // total_slides  # 75-95% range
+                    self.update_status(progress, f"Composed video for slide {i + 1}/{total_slides}")
             
             if not processed_videos:
                 self.logger.error("ERROR: No composite videos created")
                 return False
             
+            # A single composite already is the final video
+            if len(processed_videos) == 1:
+                os.replace(processed_videos[0], final_output)
+                self.logger.info(f"SUCCESS: Final video created: {final_output}")
+                return True
+            
             # Concatenate all composite videos
             self.logger.info("Concatenating all slides...")
             self.update_status(95, "Concatenating final video...")
             
             # Create file list for ffmpeg
+            # Written to a temporary name and moved into place, so an interrupted
+            # run can never leave a truncated list behind for the next one
             file_list_path = os.path.join(temp_dir, "video_list.txt")
-            with open(file_list_path, 'w') as f:
-                for video_path in processed_videos:
-                    f.write(f"file '{os.path.abspath(video_path)}'\n")
+            tmp_list_path = file_list_path + ".tmp"
+            with open(tmp_list_path, 'w', encoding='utf-8') as f:
+                f.writelines(f"file '{os.path.abspath(path)}'\n" for path in processed_videos)
+            os.replace(tmp_list_path, file_list_path)
             
             # Concatenate videos
-            final_output = os.path.join(output_dir, "final_presentation_with_slides.mp4")
             concat_cmd = [
-                "ffmpeg", "-y",
+                *FFMPEG,
+                "-fflags", "+genpts",
                 "-f", "concat",
                 "-safe", "0",
                 "-i", file_list_path,
@@ -1085,18 +2771,83 @@ class VideoComposer:
             ]
             
             self.logger.info("Concatenating videos...")
-            result = subprocess.run(concat_cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
+            returncode, output = run_streamed(concat_cmd, idle_timeout=120)
+            
+            if returncode == 0:
+                # The composites are copied into the final video; free their disk
+                # space now rather than keeping a second copy of the whole deck
+                for path in processed_videos:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
                 self.logger.info(f"SUCCESS: Final video created: {final_output}")
                 return True
             else:
-                self.logger.error(f"ERROR: Failed to concatenate videos: {result.stderr}")
+                self.logger.error(f"ERROR: Failed to concatenate videos: {output}")
                 return False
         
         except Exception as e:
             self.logger.error(f"ERROR: Video composition failed: {e}")
             return False
+    
+    def _compose_fused(self, animated_videos: List[str], slide_images: List[str],
+                       slide_durations: List[Optional[float]], final_output: str,
+                       encoder_args: List[str], overlay_xy: str) -> bool:
+        """Overlay every avatar on its slide and concatenate them with one ffmpeg filter graph"""
+        inputs = []
+        filters = []
+        concat_inputs = []
+        
+        for i, (video_path, slide_path, duration) in enumerate(zip(animated_videos, slide_images, slide_durations)):
+            duration = duration or probe_duration(video_path)
+            if duration is None:
+                self.logger.warning(f"WARNING: Could not probe duration of {video_path}")
+                return False
+            duration = min(duration, 30)  # Limit to 30 seconds max per slide
+            
+            frame_rate = probe_frame_rate(video_path) or "25"
+            
+            # Slide frame is input 2i, avatar video is input 2i+1
+            inputs += ["-t", f"{duration:.3f}", *slide_frame_input_args(slide_path, frame_rate),
+                       "-i", video_path]
+            filters.append(
+                f"[{2 * i}:v]setsar=1[bg{i}];"
+                f"[{2 * i + 1}:v]{avatar_scale_filter(video_path)}[av{i}];"
+                f"[bg{i}][av{i}]overlay={overlay_xy}[v{i}];"
+                f"[{2 * i + 1}:a]atrim=0:{duration:.3f},asetpts=PTS-STARTPTS[a{i}]"
+            )
+            concat_inputs.append(f"[v{i}][a{i}]")
+        
+        count = len(concat_inputs)
+        filters.append(f"{''.join(concat_inputs)}concat=n={count}:v=1:a=1[vcat][aout]")
+        filters.append(f"[vcat]{encoder_frame_filter(encoder_args)}[vout]")
+        
+        cmd = [
+            *FFMPEG,
+            *filter_thread_args(),
+            *inputs,
+            "-filter_complex", ";".join(filters),
+            "-map", "[vout]",
+            "-map", "[aout]",
+            *encoder_args,
+            "-c:a", "aac",
+            final_output
+        ]
+        
+        self.logger.info(f"Composing {count} slides in a single ffmpeg pass...")
+        try:
+            returncode, output = run_streamed(cmd, idle_timeout=120)
+        except subprocess.TimeoutExpired:
+            self.logger.error("ERROR: Single-pass composition stopped responding")
+            return False
+        
+        if returncode == 0 and os.path.exists(final_output) and os.path.getsize(final_output) > 0:
+            self.logger.info(f"SUCCESS: Final video created: {final_output}")
+            return True
+        
+        self.logger.error(f"ERROR: Single-pass composition failed: {output}")
+        return False
 
 class EasySpeakerAvatarSystem:
     """Easy unified system class"""
@@ -1127,11 +2878,23 @@ class EasySpeakerAvatarSystem:
             'current_step': '',
             'error': None
         }
+        
+        # Status updates are shown prominently in the terminal by a background
+        # thread, so pipeline threads never wait on console or log I/O
+        self.status_queue = queue.SimpleQueue()
+        threading.Thread(target=self._emit_status_updates, name="status", daemon=True).start()
+    
+    def _emit_status_updates(self):
+        """Print and log queued status updates"""
+        while True:
+            progress, current_step = self.status_queue.get()
+            print(f"\n🔄 STATUS UPDATE: {progress}% - {current_step}")
+            self.logger.info(f"Status updated: {progress}% - {current_step}")
     
     def _create_directories(self):
         """Create all necessary directories"""
         for dir_name in self.config.config['directories'].values():
-            os.makedirs(dir_name, exist_ok=True)
+            Path(dir_name).mkdir(parents=True, exist_ok=True)
         self.logger.info("SUCCESS: All directories created")
     
     def set_gemini_api_key(self, api_key: str):
@@ -1146,54 +2909,74 @@ class EasySpeakerAvatarSystem:
         self.tts_processor.tts_manager.set_voice(voice_name)
         self.logger.info(f"TTS voice set to: {voice_name}")
     
-    def process_presentation_async(self, pptx_path: str, face_path: str):
-        """Process presentation asynchronously"""
-        def process():
+    def process_presentation_async(self, pptx_path: str, face_path: str,
+                                   slides_data: Optional[List[Dict[str, str]]] = None):
+        """Process presentation asynchronously, reusing slides_data if it was already extracted"""
+        def process(slides_data):
+            # Bound once: the per-slide callbacks below read these for every slide
+            directories = self.config.config['directories']
+            skip_existing = self.config.config['processing']['skip_existing']
             try:
                 self.processing_status['status'] = 'processing'
                 self.processing_status['progress'] = 0
                 self.processing_status['current_step'] = 'Starting processing...'
                 self.processing_status['error'] = None
                 
+                # Step 2 runs in the background: slide images are only needed for the
+                # final composition, so rendering overlaps text extraction and audio
+                render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="render")
+                print(f"\n🖼️ STEP 2: Rendering slide images in the background...")
+                self.logger.info("Step 2: Rendering slide images in the background...")
+                render_future = render_executor.submit(
+                    self.slide_renderer.render_presentation,
+                    pptx_path, 
+                    directories['slide_images'],
+                    skip_existing
+                )
+                render_executor.shutdown(wait=False)
+                
                 # Step 1: Extract text from file
                 self.processing_status['progress'] = 5
                 self.processing_status['current_step'] = 'Extracting text from slides...'
                 print(f"\n📋 STEP 1: Extracting text from slides...")
                 self.logger.info("Step 1: Extracting text from slides...")
-                slides_data = self.ppt_processor.extract_slides_from_file(pptx_path)
+                if not slides_data:
+                    slides_data = self.ppt_processor.extract_slides_from_file(pptx_path)
                 if not slides_data:
                     raise Exception("Failed to extract slides")
                 print(f"✅ STEP 1 COMPLETED: Extracted {len(slides_data)} slides")
                 self.logger.info(f"Step 1 completed: Extracted {len(slides_data)} slides")
                 
-                # Step 2: Render slide images
-                self.processing_status['progress'] = 15
-                self.processing_status['current_step'] = 'Rendering slide images...'
-                print(f"\n🖼️ STEP 2: Rendering slide images...")
-                self.logger.info("Step 2: Rendering slide images...")
-                slide_images = self.slide_renderer.render_presentation(
-                    pptx_path, 
-                    self.config.config['directories']['slide_images']
-                )
-                if not slide_images:
-                    raise Exception("Failed to render slide images")
-                print(f"✅ STEP 2 COMPLETED: Rendered {len(slide_images)} slide images")
-                self.logger.info(f"Step 2 completed: Rendered {len(slide_images)} slide images")
-                
                 # Step 3: Generate audio
                 self.processing_status['progress'] = 25
                 self.processing_status['current_step'] = 'Generating audio...'
                 print(f"\n🎵 STEP 3: Generating audio for all slides...")
                 self.logger.info("Step 3: Generating audio...")
+                # Each slide's face animation starts as soon as its narration lands,
+                # overlapping Wav2Lip (GPU) with the rest of the synthesis (CPU)
+                def animate_when_ready(audio_path):
+                    i = (slide_number(audio_path) or 1) - 1
+                    self.wav2lip_processor.prefetch(i, audio_path, face_path,
+                                                    directories['video'], len(slides_data))
+                
                 audio_files = self.tts_processor.generate_audio_batch(
                     slides_data, 
-                    self.config.config['directories']['audio']
+                    directories['audio'],
+                    on_ready=animate_when_ready
                 )
                 if not audio_files:
                     raise Exception("Failed to generate audio")
                 print(f"✅ STEP 3 COMPLETED: Generated {len(audio_files)} audio files")
                 self.logger.info(f"Step 3 completed: Generated {len(audio_files)} audio files")
                 
+                # Collect the background render before spending time on Wav2Lip
+                self.processing_status['current_step'] = 'Finishing slide images...'
+                slide_images = render_future.result()
+                if not slide_images:
+                    raise Exception("Failed to render slide images")
+                print(f"✅ STEP 2 COMPLETED: Rendered {len(slide_images)} slide images")
+                self.logger.info(f"Step 2 completed: Rendered {len(slide_images)} slide images")
+                
                 # Step 4: Animate faces
                 self.processing_status['progress'] = 50
                 self.processing_status['current_step'] = 'Animating faces...'
@@ -1202,7 +2985,7 @@ class EasySpeakerAvatarSystem:
                 animated_videos = self.wav2lip_processor.animate_faces_batch(
                     audio_files,
                     face_path,
-                    self.config.config['directories']['video']
+                    directories['video']
                 )
                 if not animated_videos:
                     raise Exception("Failed to animate faces")
@@ -1214,7 +2997,7 @@ class EasySpeakerAvatarSystem:
                 self.processing_status['current_step'] = 'Composing final video...'
                 print(f"\n🎬 STEP 5: Composing final video...")
                 self.logger.info("Step 5: Composing final video...")
-                success = self.video_composer.compose_final_video_with_slides()
+                success = self.video_composer.compose_final_video_with_slides(self.tts_processor.audio_durations)
                 if not success:
                     raise Exception("Failed to compose final video")
                 print(f"✅ STEP 5 COMPLETED: Final video composed successfully")
@@ -1233,9 +3016,12 @@ class EasySpeakerAvatarSystem:
                 self.processing_status['error'] = str(e)
                 self.processing_status['current_step'] = f'Error: {str(e)}'
                 self.logger.error(f"ERROR: Processing failed: {e}")
+            finally:
+                # A run that failed before Step 4 leaves prefetched animations behind
+                self.wav2lip_processor.cancel_prefetch()
         
         # Start processing in background thread
-        thread = threading.Thread(target=process)
+        thread = threading.Thread(target=process, args=(slides_data,))
         thread.daemon = True
         thread.start()
     
@@ -1247,8 +3033,25 @@ class EasySpeakerAvatarSystem:
         """Get slides data for frontend display"""
         return self.ppt_processor.extract_slides_from_file(file_path)
 
-# Global system instance
-system = EasySpeakerAvatarSystem()
+# Global system instance, created in main() so worker processes that
+# re-import this module do not build a second system
+system = None
+
+# Previews speak pyttsx3 voices; when the pipeline runs another backend, a
+# separate manager with its own synthesis thread answers them
+_PREVIEW_TTS = None
+_PREVIEW_TTS_LOCK = threading.Lock()
+
+def preview_tts_manager() -> TTSManager:
+    """Get the pyttsx3 manager that lists voices and renders previews"""
+    global _PREVIEW_TTS
+    # Reuse the pipeline's engine so every driver call stays on its one thread
+    if isinstance(system.tts_processor.tts_manager, TTSManager):
+        return system.tts_processor.tts_manager
+    with _PREVIEW_TTS_LOCK:
+        if _PREVIEW_TTS is None:
+            _PREVIEW_TTS = TTSManager(system.config.config['tts'])
+        return _PREVIEW_TTS
 
 # Flask routes
 @app.route('/')
@@ -1301,8 +3104,9 @@ def process_presentation():
         # Extract slides data for immediate response
         slides_data = system.get_slides_data(presentation_path)
         
-        # Start background processing
-        system.process_presentation_async(presentation_path, face_path)
+        # Start background processing; the deck was just parsed and narrated, so
+        # hand that over instead of extracting (and calling Gemini) a second time
+        system.process_presentation_async(presentation_path, face_path, slides_data)
         
         # Return slides data for frontend display
         return jsonify({
@@ -1333,10 +3137,9 @@ def get_voices():
     """Get available TTS voices (filtered to show only the best ones)"""
     try:
         voices = []
-        if system.tts_processor.tts_manager.is_available():
-            import pyttsx3
-            engine = pyttsx3.init()
-            system_voices = engine.getProperty('voices')
+        tts_manager = preview_tts_manager()
+        if tts_manager.is_available():
+            system_voices = tts_manager.list_voices()
             
             # Filter voices to show only the best ones
             filtered_voices = []
@@ -1376,9 +3179,17 @@ def get_voices():
         logger.error(f"Error getting voices: {e}")
         return jsonify({'voices': []})
 
+def send_preview_audio(preview_path: str):
+    """Answer a preview request with the WAV itself, saving the client a second fetch"""
+    # The bytes are read up front, so a cleanup can remove the file mid-response
+    with open(preview_path, 'rb') as f:
+        audio = BytesIO(f.read())
+    return send_file(audio, mimetype='audio/wav', as_attachment=False,
+                     download_name='preview.wav')
+
 @app.route('/api/preview-voice', methods=['POST'])
 def preview_voice():
-    """Generate a voice preview and return download URL"""
+    """Generate a voice preview and return the WAV audio"""
     try:
         data = request.get_json()
         voice_name = data.get('voice_name', '')
@@ -1392,46 +3203,27 @@ def preview_voice():
         preview_dir = "previews"
         os.makedirs(preview_dir, exist_ok=True)
         
-        # Create a safe filename
-        safe_voice_name = "".join(c for c in voice_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_voice_name = safe_voice_name.replace(' ', '_')
-        preview_filename = f"preview_{safe_voice_name}.wav"
+        # Previews are deterministic, so name them after everything that shapes
+        # the audio and serve an existing one without starting an engine
+        preview_text = "This is a voice preview."
+        key = hashlib.sha1(f"{voice_name}|{preview_text}|150|0.9".encode()).hexdigest()
+        preview_filename = f"preview_{key}.wav"
         preview_path = os.path.join(preview_dir, preview_filename)
         
-        # Create a new TTS manager instance for preview to avoid conflicts
+        if os.path.exists(preview_path) and os.path.getsize(preview_path) > 0:
+            logger.info(f"SUCCESS: Reused voice preview for {voice_name}")
+            return send_preview_audio(preview_path)
+        
         try:
-            import pyttsx3
-            preview_engine = pyttsx3.init()
-            preview_engine.setProperty('rate', 150)
-            preview_engine.setProperty('volume', 0.9)
-            
-            # Set the voice
-            voices = preview_engine.getProperty('voices')
-            voice_found = False
-            for voice in voices:
-                if voice.name == voice_name:
-                    preview_engine.setProperty('voice', voice.id)
-                    voice_found = True
-                    break
-            
-            if not voice_found:
-                logger.warning(f"Voice {voice_name} not found, using default")
-            
-            # Generate preview audio
-            preview_text = "This is a voice preview."
-            preview_engine.save_to_file(preview_text, preview_path)
-            preview_engine.runAndWait()
-            
-            # Wait for file to be written
-            time.sleep(1)
+            # Generate preview audio under a temporary name, so a half-written
+            # file is never served as a cached preview
+            tmp_path = os.path.join(preview_dir, f"preview_{key}.tmp.wav")
+            if preview_tts_manager().preview(preview_text, tmp_path, voice_name):
+                os.replace(tmp_path, preview_path)
             
             if os.path.exists(preview_path) and os.path.getsize(preview_path) > 0:
                 logger.info(f"SUCCESS: Generated voice preview for {voice_name}")
-                return jsonify({
-                    'success': True,
-                    'download_url': f'/api/download-preview/{preview_filename}',
-                    'voice_name': voice_name
-                })
+                return send_preview_audio(preview_path)
             else:
                 logger.error(f"Failed to generate preview audio file")
                 return jsonify({'error': 'Failed to generate preview audio'}), 500
@@ -1452,7 +3244,10 @@ def download_preview(filename):
         file_path = os.path.join(preview_dir, filename)
         
         if os.path.exists(file_path):
-            return send_from_directory(preview_dir, filename, as_attachment=True)
+            # send_from_directory guards against path traversal in the URL and
+            # passes the conditional/Range options through to send_file
+            return send_from_directory(preview_dir, filename, as_attachment=True, mimetype='audio/wav',
+                                       conditional=True, etag=True)
         else:
             return jsonify({'error': 'Preview file not found'}), 404
             
@@ -1465,7 +3260,11 @@ def download_video():
     """Download the final video"""
     video_path = os.path.join('output', 'final_presentation_with_slides.mp4')
     if os.path.exists(video_path):
-        return send_from_directory('output', 'final_presentation_with_slides.mp4', as_attachment=True)
+        # Conditional responses answer Range requests (seeking, resumed
+        # downloads) and If-None-Match revalidation without resending the file
+        return send_file(video_path, mimetype='video/mp4', as_attachment=True,
+                         download_name='final_presentation_with_slides.mp4',
+                         conditional=True, etag=True, last_modified=os.path.getmtime(video_path))
     else:
         return jsonify({'error': 'Video not ready yet'}), 404
 
@@ -1476,12 +3275,13 @@ def cleanup_files():
         # Clean up directories
         directories_to_clean = ['audio', 'video', 'output', 'slide_images', 'temp', 'uploads', 'previews']
         
+        # Warm Wav2Lip workers run inside temp/, so stop them first
+        system.wav2lip_processor.close()
+        
+        # rmtree unlinks in C and also clears stale subdirectories (e.g. Wav2Lip scratch dirs)
         for directory in directories_to_clean:
-            if os.path.exists(directory):
-                for file in os.listdir(directory):
-                    file_path = os.path.join(directory, file)
-                    if os.path.isfile(file_path):
-                        os.remove(file_path)
+            shutil.rmtree(directory, ignore_errors=True)
+            Path(directory).mkdir(parents=True, exist_ok=True)
         
         # Reset processing status
         system.processing_status = {
@@ -1523,14 +3323,23 @@ def reset_system():
         return jsonify({'error': str(e)}), 500
 
 def open_browser():
-    """Open the web browser automatically"""
+    """Open the web browser automatically once the server accepts connections"""
+    import socket
     import webbrowser
-    import time
-    time.sleep(2)  # Wait for server to start
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', 5000), timeout=0.05).close()
+            break
+        except OSError:
+            time.sleep(0.05)
     webbrowser.open('http://localhost:5000')
 
 def main():
     """Main function to run the unified system"""
+    global system
+    system = EasySpeakerAvatarSystem()
+    
     print("🎬 Easy AI Speaker Avatar System")
     print("=" * 50)
     print("🚀 Starting unified system...")
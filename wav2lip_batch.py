@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Wav2Lip batch runner
+====================
+Runs Wav2Lip inference for several audio files in one process, so PyTorch,
+the checkpoint and face detection are loaded once instead of once per slide.
+
+Usage: python wav2lip_batch.py manifest.json
+       python wav2lip_batch.py --serve manifest.json
+
+The manifest lists the Wav2Lip checkout, checkpoint, face image, extra
+inference.py options and the (audio, outfile) jobs. With --serve the jobs
+are instead read as JSON lines from stdin ({"audio", "outfile", "face"})
+and each gets one JSON line reply ({"ok", "out", "error"}) on stdout, so
+one warm process can serve a whole run. Run it from a scratch directory:
+inference.py writes its intermediate files to ./temp.
+
+If the manifest names ffmpeg "encoder" arguments, frames are piped straight
+into one ffmpeg encode of the final video instead of being written to
+temp/result.avi and re-encoded by inference.py's muxing step. With "fp16"
+set, the model runs under CUDA autocast when a GPU is in use.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+def load_inference(manifest):
+    """Import Wav2Lip's inference module with arguments for the first job"""
+    sys.path.insert(0, os.path.abspath(manifest["wav2lip_path"]))
+    jobs = manifest.get("jobs") or [{"audio": "", "outfile": "results/result_voice.mp4"}]
+    first_job = jobs[0]
+    
+    # inference.py parses sys.argv when it is imported
+    sys.argv = [
+        "inference.py",
+        "--checkpoint_path", manifest["checkpoint_path"],
+        "--face", manifest["face"],
+        "--audio", first_job["audio"],
+        "--outfile", first_job["outfile"],
+        *manifest.get("args", []),
+    ]
+    import inference
+    return inference
+
+class PipeWriter:
+    """cv2.VideoWriter stand-in that pipes raw frames into an ffmpeg encode of the job's outfile"""
+    
+    # The writer of the job in progress, so a failed job can stop its encode
+    active = None
+    
+    def __init__(self, inference, encoder_args, frame_filter, fps, size):
+        width, height = size
+        self.outfile = inference.args.outfile
+        self.process = subprocess.Popen([
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{width}x{height}", "-r", str(fps), "-i", "pipe:0",
+            "-i", inference.args.audio,
+            "-map", "0:v", "-map", "1:a",
+            "-vf", f"scale=trunc(iw/2)*2:trunc(ih/2)*2,{frame_filter}",  # H.264 needs even dimensions
+            *encoder_args,
+            "-c:a", "aac",
+            "-shortest",
+            inference.args.outfile
+        ], stdin=subprocess.PIPE)
+        PipeWriter.active = self
+    
+    def write(self, frame):
+        self.process.stdin.write(frame.tobytes())
+    
+    def release(self):
+        PipeWriter.active = None
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with code {self.process.returncode}")
+    
+    def abort(self):
+        """Kill the encode of a failed job and delete the partial outfile"""
+        PipeWriter.active = None
+        self.process.kill()
+        self.process.wait()
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        if os.path.exists(self.outfile):
+            os.remove(self.outfile)
+
+def pipe_frames_to_ffmpeg(inference, encoder_args, frame_filter):
+    """Encode frames as inference produces them and drop its avi round trip"""
+    inference.cv2.VideoWriter = lambda path, fourcc, fps, size: PipeWriter(
+        inference, encoder_args, frame_filter, fps, size)
+    
+    # The outfile is already complete, so the mux of temp/result.avi has nothing to do.
+    # This process only runs Wav2Lip, so patching the subprocess module is safe here
+    call = inference.subprocess.call
+    
+    def call_unless_mux(command, *args, **kwargs):
+        if "temp/result.avi" in str(command):
+            return 0
+        return call(command, *args, **kwargs)
+    
+    inference.subprocess.call = call_unless_mux
+
+def run_in_half_precision(inference, model):
+    """Run the model's forward pass under CUDA autocast, returning float32 like before"""
+    torch = inference.torch
+    forward = model.forward
+    
+    def forward_fp16(*args, **kwargs):
+        with torch.autocast("cuda", dtype=torch.float16):
+            return forward(*args, **kwargs).float()
+    
+    model.forward = forward_fp16
+
+def reuse_expensive_steps(inference, fp16=False):
+    """Make every job after the first skip the model load and face detection"""
+    model = inference.load_model(inference.args.checkpoint_path)
+    if fp16 and inference.device == "cuda":
+        run_in_half_precision(inference, model)
+    inference.load_model = lambda path: model
+    
+    # Each face is a single static image, so its detection never changes
+    detect_faces = inference.face_detect
+    detections = {}
+    
+    def face_detect_once(images):
+        face = inference.args.face
+        if face not in detections:
+            detections[face] = detect_faces(images)
+        return detections[face]
+    
+    inference.face_detect = face_detect_once
+
+def run_job(inference, job):
+    """Run inference for one job"""
+    inference.args.face = job.get("face", inference.args.face)
+    inference.args.audio = job["audio"]
+    inference.args.outfile = job["outfile"]
+    try:
+        inference.main()
+    except Exception as e:
+        # Otherwise ffmpeg would wait on stdin for the life of a --serve worker and
+        # finalize a partial file over the retry's output when the worker exits
+        if PipeWriter.active is not None:
+            PipeWriter.active.abort()
+        # Hand cached blocks back after an OOM so a retry in this process can fit
+        if isinstance(e, RuntimeError) and "out of memory" in str(e) and inference.torch.cuda.is_available():
+            inference.torch.cuda.empty_cache()
+        raise
+
+def serve(inference, replies):
+    """Answer one JSON line on replies for every job read from stdin"""
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        try:
+            run_job(inference, job)
+            reply = {"ok": True, "out": job["outfile"]}
+        except Exception as e:
+            reply = {"ok": False, "out": job["outfile"], "error": str(e)}
+        replies.write(json.dumps(reply) + "\n")
+        replies.flush()
+    return 0
+
+def main():
+    """Run every job in the manifest, reporting each result on stdout"""
+    serve_mode = sys.argv[1] == "--serve"
+    with open(sys.argv[-1], encoding="utf-8") as f:
+        manifest = json.load(f)
+    
+    if serve_mode:
+        # Keep the real stdout for replies and send everything else that
+        # Wav2Lip (or the ffmpeg it spawns) prints there to stderr instead
+        replies = os.fdopen(os.dup(1), "w")
+        os.dup2(2, 1)
+        sys.stdout = sys.stderr
+    
+    os.makedirs("temp", exist_ok=True)
+    inference = load_inference(manifest)
+    reuse_expensive_steps(inference, manifest.get("fp16", False))
+    if manifest.get("encoder"):
+        pipe_frames_to_ffmpeg(inference, manifest["encoder"], manifest.get("frame_filter", "format=yuv420p"))
+    
+    if serve_mode:
+        return serve(inference, replies)
+    
+    failures = 0
+    for job in manifest["jobs"]:
+        try:
+            run_job(inference, job)
+            print(f"DONE {job['outfile']}", flush=True)
+        except Exception as e:
+            print(f"FAILED {job['outfile']}: {e}", flush=True)
+            failures += 1
+    
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())